@@ -0,0 +1,45 @@
+"""
+Serializzazione JSON veloce.
+Usa orjson se installato, altrimenti ripiega sul modulo json standard.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson as _json_impl
+except ImportError:
+    import json as _json_impl
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decodifica un documento JSON da bytes o stringa.
+
+    Args:
+        data (Union[bytes, str]): Contenuto JSON
+
+    Returns:
+        Any: Oggetto Python decodificato
+    """
+    return _json_impl.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Codifica un oggetto in JSON (UTF-8).
+
+    Args:
+        obj (Any): Oggetto da serializzare
+        indent (bool): Se True indenta con 2 spazi
+
+    Returns:
+        bytes: Documento JSON codificato in UTF-8
+    """
+    if HAS_ORJSON:
+        option = _json_impl.OPT_NON_STR_KEYS
+        if indent:
+            option |= _json_impl.OPT_INDENT_2
+        return _json_impl.dumps(obj, option=option)
+
+    return _json_impl.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
@@ -6,12 +6,13 @@ gestione componenti e serial number.
 
 import json
 import os
-from typing import List, Dict, Optional, Union
+from typing import Callable, Iterable, List, Dict, Optional, Union
 from datetime import datetime
 from pathlib import Path
 
 # Librerie per Excel/PDF/Word
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 import pandas as pd
@@ -21,6 +22,29 @@ from reportlab.lib.utils import ImageReader
 from reportlab.lib.units import cm, mm
 from reportlab.lib import colors
 
+# Motore per pd.read_excel: calamine (Rust) se installato, altrimenti openpyxl
+try:
+    import python_calamine  # noqa: F401
+except ImportError:
+    EXCEL_READ_ENGINE = "openpyxl"
+else:
+    EXCEL_READ_ENGINE = "calamine"
+
+
+# Testi che pd.read_excel considera valori mancanti (na_values predefiniti di pandas)
+_VALORI_NA_PANDAS = frozenset((
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+))
+
+
+class ColonnaMancanteError(ValueError):
+    """Una colonna richiesta non è presente nel file di input."""
+
+    def __init__(self, colonna: str):
+        self.colonna = colonna
+        super().__init__(f"Colonna '{colonna}' non trovata nel file")
+
 
 # ============================================================================
 # GESTIONE COMPONENTI E DATABASE
@@ -29,6 +53,15 @@ from reportlab.lib import colors
 class GestioneComponenti:
     """Classe per gestire i componenti con persistenza su file JSON."""
 
+    # Campi facoltativi di un componente e valore usato quando mancano nel file
+    CAMPI_DEFAULT = {
+        'code_12nc': None,
+        'sn_iniziale': None,
+        'prefisso_tipo_scheda': None,
+        'indicizzazione': True,
+        'inizio_indicizzazione_prefisso': None
+    }
+
     def __init__(self, file_componenti: str = "DB/componenti_database.json"):
         """
         Inizializza il gestore componenti.
@@ -38,12 +71,15 @@ class GestioneComponenti:
         """
         self.file_componenti = file_componenti
         self.componenti = self._carica_componenti()
+        # Incrementata ad ogni salvataggio: permette alle viste di capire se i dati sono cambiati
+        self.revisione = 0
 
     def _carica_componenti(self) -> List[Dict]:
         """
         Carica i componenti dal file JSON.
-        Aggiunge automaticamente il campo 'inizio_indicizzazione_prefisso' ai componenti
-        che non lo possiedono (migrazione automatica).
+        Aggiunge automaticamente i campi di CAMPI_DEFAULT ai componenti che non
+        li possiedono (migrazione automatica): dopo il caricamento ogni componente
+        ha tutti i campi.
 
         Returns:
             List[Dict]: Lista di componenti
@@ -53,12 +89,13 @@ class GestioneComponenti:
                 with open(self.file_componenti, 'r', encoding='utf-8') as f:
                     componenti = json.load(f)
                 
-                # Migrazione automatica: aggiungi il campo mancante ai componenti vecchi
+                # Migrazione automatica: aggiungi i campi mancanti ai componenti vecchi
                 migrazione_necessaria = False
                 for comp in componenti:
-                    if 'inizio_indicizzazione_prefisso' not in comp:
-                        comp['inizio_indicizzazione_prefisso'] = None
-                        migrazione_necessaria = True
+                    for campo, default in self.CAMPI_DEFAULT.items():
+                        if campo not in comp:
+                            comp[campo] = default
+                            migrazione_necessaria = True
                 
                 # Se necessaria la migrazione, salva subito il file aggiornato
                 if migrazione_necessaria:
@@ -80,6 +117,7 @@ class GestioneComponenti:
 
     def _salva_componenti(self):
         """Salva i componenti nel file JSON."""
+        self.revisione += 1
         try:
             with open(self.file_componenti, 'w', encoding='utf-8') as f:
                 json.dump(self.componenti, f, ensure_ascii=False, indent=2)
@@ -665,8 +703,9 @@ class DataProcessor:
     """Classe per l'elaborazione dei dati Excel."""
 
     @staticmethod
-    def generate_csv_reg(input_file: Path, output_file: Path, selected_descriptions: List[str],
-                        extra_fields: dict = None) -> int:
+    def generate_csv_reg(input_file: Path, output_file: Path, selected_descriptions: Iterable[str],
+                        extra_fields: dict = None,
+                        progress_cb: Optional[Callable[[int, int], None]] = None) -> int:
         """
         Genera un file CSV Reg filtrando per descrizioni selezionate.
 
@@ -675,6 +714,7 @@ class DataProcessor:
             output_file: Percorso del file Excel di output
             selected_descriptions: Lista delle descrizioni da includere
             extra_fields: Campi extra da aggiungere (da interfaccia)
+            progress_cb: Chiamata ogni 256 righe lette come progress_cb(lette, totali)
 
         Returns:
             int: Numero di righe generate
@@ -685,6 +725,9 @@ class DataProcessor:
         if extra_fields is None:
             extra_fields = {}
 
+        # Insieme per un controllo di appartenenza O(1) su ogni riga
+        selected_descriptions = frozenset(selected_descriptions)
+
         wb_input = load_workbook(input_file)
         ws_input = wb_input.active
 
@@ -742,7 +785,17 @@ class DataProcessor:
             "Ente_Trasporto": "Ente_Trasporto"
         }
 
+        # I campi da interfaccia sono uguali per tutte le righe: formattati una sola volta
+        extra_row_data = {}
+        for extra_field_name, output_col_name in extra_fields_to_output.items():
+            value = extra_fields.get(extra_field_name, "")
+            extra_row_data[output_col_name] = str(value).upper() if value else ""
+
+        total_rows = ws_input.max_row - 1
         for input_row in range(2, ws_input.max_row + 1):
+            if progress_cb is not None and (input_row - 1) % 256 == 0:
+                progress_cb(input_row - 1, total_rows)
+
             descrizione = ws_input.cell(row=input_row, column=desc_col_idx).value
 
             if descrizione and descrizione in selected_descriptions:
@@ -758,9 +811,7 @@ class DataProcessor:
                         row_data[output_col_name] = ""
 
                 # Aggiungi i dati dall'interfaccia (extra_fields)
-                for extra_field_name, output_col_name in extra_fields_to_output.items():
-                    value = extra_fields.get(extra_field_name, "")
-                    row_data[output_col_name] = str(value).upper() if value else ""
+                row_data.update(extra_row_data)
 
                 # Popola SN1 e SN3 ricavandoli dal campo SN (split sul primo spazio)
                 # Comportamento: SN1 = prima parte; SN3 = seconda parte (se presente).
@@ -789,6 +840,9 @@ class DataProcessor:
 
                 output_row += 1
 
+        if progress_cb is not None:
+            progress_cb(total_rows, total_rows)
+
         rows_generated = output_row - 2
         if rows_generated == 0:
             raise ValueError("Nessuna riga trovata con le descrizioni selezionate")
@@ -822,7 +876,7 @@ class DataProcessor:
         return rows_generated
 
     @staticmethod
-    def generate_import_gestionale(input_file: Path, output_file: Path, selected_descriptions: List[str],
+    def generate_import_gestionale(input_file: Path, output_file: Path, selected_descriptions: Iterable[str],
                                    extra_fields: dict = None) -> int:
         """
         Genera un file Import Gestionale filtrando per descrizioni selezionate.
@@ -842,20 +896,45 @@ class DataProcessor:
         if extra_fields is None:
             extra_fields = {}
 
-        wb_input = load_workbook(input_file)
-        ws_input = wb_input.active
+        # Insieme per un controllo di appartenenza O(1) su ogni riga
+        selected_descriptions = frozenset(selected_descriptions)
 
-        input_headers = [cell.value for cell in ws_input[1]]
-        input_col_map = {header: idx + 1 for idx, header in enumerate(input_headers)}
+        # Input in sola lettura e output in sola scrittura: le righe vengono lette
+        # e scritte una alla volta senza tenere in memoria i due fogli interi
+        wb_input = load_workbook(input_file, read_only=True, data_only=True, keep_links=False)
+        try:
+            return DataProcessor._scrivi_import_gestionale(
+                wb_input.active, output_file, selected_descriptions, extra_fields
+            )
+        finally:
+            wb_input.close()
+
+    @staticmethod
+    def _scrivi_import_gestionale(ws_input, output_file: Path, selected_descriptions: frozenset,
+                                  extra_fields: dict) -> int:
+        """
+        Scrive il file Import Gestionale leggendo il foglio di input riga per riga.
+
+        Args:
+            ws_input: Foglio di input (aperto in sola lettura)
+            output_file: Percorso del file Excel di output
+            selected_descriptions: Insieme delle descrizioni da includere
+            extra_fields: Campi extra da aggiungere (da interfaccia)
+
+        Returns:
+            int: Numero di righe generate
+        """
+        rows_input = ws_input.iter_rows(values_only=True)
+        input_headers = next(rows_input, ())
+        input_col_map = {header: idx for idx, header in enumerate(input_headers)}
 
         required_cols = ["Fornitore", "Descrizione", "CODE 12NC", "SN", "Bus", "Tipo Scheda"]
         for col in required_cols:
             if col not in input_col_map:
                 raise ValueError(f"Colonna '{col}' non trovata nel file di input")
 
-        wb_output = Workbook()
-        ws_output = wb_output.active
-        ws_output.title = "ImportGestionale"
+        wb_output = Workbook(write_only=True)
+        ws_output = wb_output.create_sheet(title="ImportGestionale")
 
         # Definisci tutti i campi di output nell'ordine richiesto per Import Gestionale
         output_headers = [
@@ -868,11 +947,20 @@ class DataProcessor:
             "Unità techrail 3::CB Codice 12NC", "CB matricola", "Data Ricezione",
             "Ordine Acquisto", "NUC CB", "Nota", "SISTEMA", "flag"
         ]
-        for col_idx, header_value in enumerate(output_headers, start=1):
-            cell = ws_output.cell(row=1, column=col_idx, value=header_value)
+
+        # Configura le larghezze delle colonne (tutte 15 per uniformità, puoi personalizzare).
+        # In modalità write_only vanno impostate prima di scrivere le righe
+        for col_idx in range(1, len(output_headers) + 1):
+            ws_output.column_dimensions[get_column_letter(col_idx)].width = 15
+
+        header_cells = []
+        for header_value in output_headers:
+            cell = WriteOnlyCell(ws_output, value=header_value)
             DataProcessor._formatta_header(cell)
+            header_cells.append(cell)
+        ws_output.append(header_cells)
 
-        output_row = 2
+        rows_generated = 0
         desc_col_idx = input_col_map["Descrizione"]
 
         # Mapping tra nomi colonne input e output (per colonne che vengono dal file input)
@@ -919,8 +1007,14 @@ class DataProcessor:
             "Data ordine": "Data ordine"
         }
 
-        for input_row in range(2, ws_input.max_row + 1):
-            descrizione = ws_input.cell(row=input_row, column=desc_col_idx).value
+        # I campi da interfaccia sono uguali per tutte le righe: formattati una sola volta
+        extra_row_data = {}
+        for extra_field_name, output_col_name in extra_fields_to_output.items():
+            value = extra_fields.get(extra_field_name, "")
+            extra_row_data[output_col_name] = str(value).upper() if value else ""
+
+        for row in rows_input:
+            descrizione = row[desc_col_idx] if desc_col_idx < len(row) else None
 
             if descrizione and descrizione in selected_descriptions:
                 # Prepara i dati per questa riga
@@ -928,16 +1022,15 @@ class DataProcessor:
 
                 # Leggi i dati dal file input
                 for input_col_name, output_col_name in input_to_output.items():
-                    if input_col_name in input_col_map:
-                        value = ws_input.cell(row=input_row, column=input_col_map[input_col_name]).value
+                    col_idx = input_col_map.get(input_col_name)
+                    if col_idx is not None and col_idx < len(row):
+                        value = row[col_idx]
                         row_data[output_col_name] = str(value).upper() if value else ""
                     else:
                         row_data[output_col_name] = ""
 
                 # Aggiungi i dati dall'interfaccia (extra_fields)
-                for extra_field_name, output_col_name in extra_fields_to_output.items():
-                    value = extra_fields.get(extra_field_name, "")
-                    row_data[output_col_name] = str(value).upper() if value else ""
+                row_data.update(extra_row_data)
 
                 # Popola SN1, SN2 e SN3 ricavandoli dal campo SN (split sul primo spazio)
                 # Comportamento: SN1 = prima parte; SN2 = vuoto; SN3 = seconda parte (se presente).
@@ -957,25 +1050,20 @@ class DataProcessor:
                     row_data['SN3'] = ''
 
                 # Scrivi i dati nella riga di output
-                for col_idx, header_name in enumerate(output_headers, start=1):
-                    if header_name=='SN':
-                        row_data['SN']=''
-                    if header_name=='Fornitore':
-                        row_data['Fornitore']=''
-                    cell_value = row_data.get(header_name, "")
-                    cell = ws_output.cell(row=output_row, column=col_idx, value=cell_value)
+                row_data['SN'] = ''
+                row_data['Fornitore'] = ''
+                output_cells = []
+                for header_name in output_headers:
+                    cell = WriteOnlyCell(ws_output, value=row_data.get(header_name, ""))
                     DataProcessor._formatta_cella(cell)
+                    output_cells.append(cell)
+                ws_output.append(output_cells)
 
-                output_row += 1
+                rows_generated += 1
 
-        rows_generated = output_row - 2
         if rows_generated == 0:
             raise ValueError("Nessuna riga trovata con le descrizioni selezionate")
 
-        # Configura le larghezze delle colonne (tutte 15 per uniformità, puoi personalizzare)
-        for col_idx in range(1, len(output_headers) + 1):
-            ws_output.column_dimensions[ws_output.cell(1, col_idx).column_letter].width = 15
-
         wb_output.save(output_file)
         return rows_generated
 
@@ -1008,23 +1096,125 @@ class DataProcessor:
         if not Path(input_file).exists():
             raise FileNotFoundError(f"File non trovato: {input_file}")
 
-        wb = load_workbook(input_file, read_only=True)
-        ws = wb.active
-
-        headers = [cell.value for cell in ws[1]]
+        # In modalità read_only ws.cell() rilegge il foglio a ogni chiamata:
+        # si scorre una sola volta la colonna con iter_rows
+        wb = load_workbook(input_file, read_only=True, data_only=True, keep_links=False)
         try:
-            desc_col_idx = headers.index("Descrizione") + 1
-        except ValueError:
-            raise ValueError("Colonna 'Descrizione' non trovata nel file")
+            ws = wb.active
+
+            headers = next(ws.iter_rows(max_row=1, values_only=True), ())
+            try:
+                desc_col_idx = headers.index("Descrizione") + 1
+            except ValueError:
+                raise ColonnaMancanteError("Descrizione")
 
-        descriptions = set()
-        for row in range(2, ws.max_row + 1):
-            desc = ws.cell(row=row, column=desc_col_idx).value
-            if desc and desc.strip():
-                descriptions.add(desc.strip())
+            descriptions = set()
+            for (desc,) in ws.iter_rows(min_row=2, min_col=desc_col_idx, max_col=desc_col_idx,
+                                        values_only=True):
+                if desc and desc.strip():
+                    descriptions.add(desc.strip())
+        finally:
+            wb.close()
 
-        wb.close()
-        return sorted(list(descriptions))
+        return sorted(descriptions)
+
+    @staticmethod
+    def _nomi_colonne(headers) -> List:
+        """
+        Calcola i nomi delle colonne come pd.read_excel: le intestazioni vuote
+        diventano "Unnamed: n" e le ripetute "X.1", "X.2", ... saltando i nomi
+        già presenti (le colonne senza nome vengono rinominate per ultime).
+        """
+        senza_nome = [idx for idx, nome in enumerate(headers) if nome is None or nome == ""]
+        nomi = list(headers)
+        for idx in senza_nome:
+            nomi[idx] = f"Unnamed: {idx}"
+
+        conteggi: Dict = {}
+        da_nominare = set(senza_nome)
+        for idx in [i for i in range(len(nomi)) if i not in da_nominare] + senza_nome:
+            nome = originale = nomi[idx]
+            n = conteggi.get(nome, 0)
+            while n > 0:
+                conteggi[originale] = n + 1
+                nome = f"{originale}.{n}"
+                n = n + 1 if nome in nomi else conteggi.get(nome, 0)
+            nomi[idx] = nome
+            conteggi[nome] = n + 1
+        return nomi
+
+    @staticmethod
+    def read_excel_fast(input_file: Path, usecols: Optional[Callable[[str], bool]] = None,
+                        dtype=None) -> pd.DataFrame:
+        """
+        Legge il primo foglio di un file Excel in un DataFrame.
+
+        Con calamine delega a pd.read_excel; con openpyxl apre il workbook in sola
+        lettura (senza stili né formule) e costruisce il DataFrame per colonne
+        seguendo le regole di pd.read_excel: primo foglio, righe e colonne vuote
+        in fondo scartate, celle vuote e na_values predefiniti come NaN, numeri
+        interi come int, intestazioni vuote o ripetute rinominate.
+
+        Args:
+            input_file: Percorso del file Excel
+            usecols: Funzione che riceve il nome di una colonna e dice se leggerla
+            dtype: str per leggere tutti i valori come testo
+
+        Returns:
+            pd.DataFrame: Dati del foglio, celle vuote come valori mancanti
+        """
+        if EXCEL_READ_ENGINE != "openpyxl":
+            return pd.read_excel(input_file, usecols=usecols, dtype=dtype, engine=EXCEL_READ_ENGINE)
+
+        wb = load_workbook(input_file, read_only=True, data_only=True, keep_links=False)
+        try:
+            rows = wb.worksheets[0].iter_rows(values_only=True)
+            headers = next(rows, ())
+            nomi = DataProcessor._nomi_colonne(headers)
+            indici = [idx for idx, nome in enumerate(nomi) if usecols is None or usecols(nome)]
+            colonne = [[] for _ in indici]
+
+            # Le colonne senza intestazione in fondo al foglio (es. solo formattate)
+            # restano solo se contengono dati
+            larghezza = max((idx + 1 for idx, h in enumerate(headers) if h is not None and h != ""),
+                            default=0)
+            senza_intestazione = range(len(headers) - 1, larghezza - 1, -1)
+
+            as_str = dtype is str
+            mancante = float("nan")
+            # Righe lette fino all'ultima non vuota: quelle vuote in fondo vengono scartate
+            n_righe = 0
+            for riga, row in enumerate(rows, 1):
+                n = len(row)
+                if any(v is not None and v != "" for v in row):
+                    n_righe = riga
+                    for j in senza_intestazione:
+                        if j < larghezza:
+                            break
+                        if j < n and row[j] is not None and row[j] != "":
+                            larghezza = j + 1
+                            break
+                for idx, valori in zip(indici, colonne):
+                    value = row[idx] if idx < n else None
+                    if value is None:
+                        value = mancante
+                    elif value.__class__ is str:
+                        if value in _VALORI_NA_PANDAS:
+                            value = mancante
+                    elif value.__class__ is float and value.is_integer():
+                        value = int(value)
+                    if as_str and value is not mancante:
+                        value = str(value)
+                    valori.append(value)
+        finally:
+            wb.close()
+
+        dati = {nomi[idx]: valori[:n_righe]
+                for idx, valori in zip(indici, colonne) if idx < larghezza}
+        if not dati:
+            # Nessuna colonna letta: DataFrame vuoto, senza righe
+            return pd.DataFrame(columns=pd.Index([], dtype=object))
+        return pd.DataFrame(dati, dtype=str if as_str else (None if n_righe else object))
 
     @staticmethod
     def _formatta_header(cell):
@@ -1065,7 +1255,8 @@ class PDFLabelGenerator:
 
     @staticmethod
     def generate_pdf_labels(input_file, output_file, image_path, filter_enabled=False, selected_tipo_scheda=None,
-                          repetitions=1, start_column=1, start_row=1, font_size=5, image_width_mm=10):
+                          repetitions=1, start_column=1, start_row=1, font_size=5, image_width_mm=10,
+                          df: Optional[pd.DataFrame] = None):
         """
         Genera un PDF con etichette contenenti immagine e testo.
 
@@ -1080,11 +1271,12 @@ class PDFLabelGenerator:
             start_row: Riga iniziale
             font_size: Dimensione font
             image_width_mm: Larghezza immagine in mm
+            df: Dati già letti da input_file (non vengono modificati), se None il file viene letto ora
 
         Returns:
             Numero di etichette generate
         """
-        df_input = pd.read_excel(input_file)
+        df_input = df if df is not None else pd.read_excel(input_file, engine=EXCEL_READ_ENGINE)
         df_input = df_input[pd.notna(df_input['Tipo Scheda'])].copy()
 
         if filter_enabled:
@@ -1210,7 +1402,8 @@ class WordLabelGenerator:
 
     @staticmethod
     def generate_word_labels(input_file, output_file, filter_enabled=False, selected_tipo_scheda=None,
-                            *args, add_counter=True, add_black_labels=True):
+                            *args, add_counter=True, add_black_labels=True,
+                            df: Optional[pd.DataFrame] = None):
         """
         Genera un PDF con le etichette in formato tabella A4 Portrait.
 
@@ -1222,6 +1415,7 @@ class WordLabelGenerator:
             *args: Parametri posizionali legacy
             add_counter: Se aggiungere il contatore Bus
             add_black_labels: Se aggiungere le etichette con sfondo nero
+            df: Dati già letti da input_file (non vengono modificati), se None il file viene letto ora
 
         Returns:
             Numero di etichette generate
@@ -1230,7 +1424,7 @@ class WordLabelGenerator:
         start_column = args[1] if len(args) > 1 else 1
         start_row = args[2] if len(args) > 2 else 1
 
-        df_input = pd.read_excel(input_file)
+        df_input = df if df is not None else pd.read_excel(input_file, engine=EXCEL_READ_ENGINE)
 
         if filter_enabled:
             if not selected_tipo_scheda:
@@ -1241,12 +1435,17 @@ class WordLabelGenerator:
         else:
             df_filtered = df_input.copy()
 
-        combinations = df_filtered[['Bus', 'Tipo Scheda']].drop_duplicates().sort_values(by=['Bus', 'Tipo Scheda'])
+        # Le righe senza Bus né Tipo Scheda (es. righe vuote nel foglio) non generano etichette
+        combinations = (df_filtered[['Bus', 'Tipo Scheda']].dropna(how='all')
+                        .drop_duplicates().sort_values(by=['Bus', 'Tipo Scheda']))
 
         labels = []
         for _, row in combinations.iterrows():
             bus = row['Bus']
             tipo = row['Tipo Scheda']
+            # Con righe vuote nel foglio la colonna Bus diventa float (1.0): si torna all'intero
+            if isinstance(bus, float) and bus.is_integer():
+                bus = int(bus)
             bus_str = str(bus).replace("BUS", "").strip()
             if add_counter:
                 labels.append(f"BUS {bus_str} – {tipo}")
@@ -0,0 +1,61 @@
+"""
+Confronto tra la lettura openpyxl di DataProcessor.read_excel_fast e pd.read_excel.
+"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+openpyxl = pytest.importorskip("openpyxl")
+pytest.importorskip("reportlab")
+
+from openpyxl.styles import PatternFill
+
+import business_logic
+from business_logic import DataProcessor
+
+
+def _crea_file(path, righe, righe_formattate=0, colonne_formattate=0):
+    """Scrive le righe nel primo foglio e formatta celle vuote sotto i dati."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for riga in righe:
+        ws.append(riga)
+    giallo = PatternFill("solid", start_color="FFFF00")
+    for r in range(len(righe) + 1, len(righe) + 1 + righe_formattate):
+        for c in range(1, colonne_formattate + 1):
+            ws.cell(row=r, column=c).fill = giallo
+    # Un secondo foglio attivo non deve essere letto
+    wb.create_sheet("Altro").append(["Altro"])
+    wb.active = 1
+    wb.save(path)
+    return path
+
+
+FILE_ETICHETTE = [
+    ["Descrizione", "Tipo Scheda", "Bus", "Descrizione", None, "SN"],
+    ["Scheda A", "SU1", 1, "x", "y", 2.0],
+    [None, None, None, None, None, None],
+    ["Scheda B", "NA", 2, "", None, "N/A"],
+]
+
+
+@pytest.mark.parametrize("righe, righe_formattate, colonne_formattate", [
+    (FILE_ETICHETTE, 5, 6),
+    (FILE_ETICHETTE, 3, 9),
+    ([["X", "X", "X.1", None], [1, 2, 3, 4]], 0, 0),
+    ([["A", "B"]], 2, 2),
+])
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"dtype": str},
+    {"usecols": {"Descrizione", "Tipo Scheda", "Bus"}.__contains__},
+])
+def test_fallback_openpyxl_come_read_excel(tmp_path, monkeypatch, righe,
+                                           righe_formattate, colonne_formattate, kwargs):
+    path = _crea_file(tmp_path / "input.xlsx", righe, righe_formattate, colonne_formattate)
+    monkeypatch.setattr(business_logic, "EXCEL_READ_ENGINE", "openpyxl")
+
+    atteso = pd.read_excel(path, engine="openpyxl", sheet_name=0, **kwargs)
+    letto = DataProcessor.read_excel_fast(path, **kwargs)
+
+    pd.testing.assert_frame_equal(letto, atteso)
@@ -5,15 +5,50 @@ Contiene tutte le classi per le interfacce grafiche e i componenti UI.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict, List, Optional
+import tkinter.font as tkfont
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import re
+import hashlib
+from collections import OrderedDict
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
-import json
 from datetime import datetime
+import _fastjson
 from business_logic import (
     GeneratoreExcel, GestioneComponenti, DataProcessor,
-    PDFLabelGenerator, WordLabelGenerator, ExcelMerger
+    PDFLabelGenerator, WordLabelGenerator, ExcelMerger, ColonnaMancanteError
+)
+
+
+# File indice dei preset (nome, data, numero componenti) nella cartella preset
+PRESET_INDEX_FILE = "preset_index.json"
+
+# Tipi di file proposti dalle finestre di apertura/salvataggio
+EXCEL_FILETYPES = (("Excel files", "*.xlsx"), ("All files", "*.*"))
+EXCEL_INPUT_FILETYPES = (
+    ("File Excel", "*.xlsx *.xls"),
+    ("XLSX files", "*.xlsx"),
+    ("XLS files", "*.xls"),
+    ("All files", "*.*")
+)
+IMAGE_FILETYPES = (
+    ("Immagini", "*.png *.jpg *.jpeg"),
+    ("PNG files", "*.png"),
+    ("JPEG files", "*.jpg *.jpeg"),
+    ("All files", "*.*")
+)
+PDF_FILETYPES = (("PDF files", "*.pdf"), ("All files", "*.*"))
+
+# Validazione dei campi numerici durante la digitazione
+_RE_INTERO = re.compile(r"\d*")
+
+# Campi mostrati nella Treeview dei componenti (GestioneComponenti li garantisce tutti)
+_campi_componente = itemgetter(
+    'nome', 'code_12nc', 'sn_iniziale', 'prefisso_tipo_scheda',
+    'inizio_indicizzazione_prefisso', 'indicizzazione'
 )
 
 
@@ -21,44 +56,346 @@ from business_logic import (
 # FUNZIONI HELPER
 # ============================================================================
 
-def bind_mousewheel_to_canvas(canvas):
-    """Aggiunge il supporto per la rotella del mouse a un canvas scrollabile.
+@lru_cache(maxsize=8)
+def _descrizioni_in_cache(percorso: str, mtime_ns: int, dimensione: int) -> Tuple[str, ...]:
+    """Legge le descrizioni di un file; mtime e dimensione fanno parte della chiave."""
+    return tuple(DataProcessor.extract_unique_descriptions(Path(percorso)))
+
+
+def leggi_descrizioni_file(path) -> Tuple[str, ...]:
+    """Restituisce le descrizioni uniche del file Excel, rileggendolo solo se è cambiato.
+
+    La cache è condivisa da tutte le schede ed è indicizzata da percorso,
+    mtime e dimensione, così un file modificato su disco viene sempre riletto.
 
     Args:
-        canvas: Il canvas a cui aggiungere il supporto per la rotella del mouse
+        path: Percorso del file Excel
+
+    Returns:
+        Tuple[str, ...]: Descrizioni uniche ordinate
+    """
+    st = Path(path).stat()
+    return _descrizioni_in_cache(str(path), st.st_mtime_ns, st.st_size)
+
+
+# Colonne del file di input usate dalle Etichette Naz: codici, descrizione e testo delle etichette
+_COLONNE_ETICHETTE_NAZ = frozenset((
+    "CODE 12NC", "DESCRIZIONE", "Descrizione", "descrizione", "SN", "Bus", "Tipo Scheda"
+))
+
+# Colonne del file di input usate dalle Etichette Interne
+_COLONNE_ETICHETTE_INTERNE = frozenset(("Descrizione", "Tipo Scheda", "Bus"))
+
+
+@lru_cache(maxsize=4)
+def _colonne_in_cache(percorso: str, mtime_ns: int, dimensione: int,
+                      colonne: frozenset, dtype) -> pd.DataFrame:
+    """Legge le colonne richieste di un file; mtime e dimensione fanno parte della chiave."""
+    return DataProcessor.read_excel_fast(Path(percorso), usecols=colonne.__contains__, dtype=dtype)
+
+
+def leggi_colonne_file(path, colonne: frozenset, dtype=None) -> pd.DataFrame:
+    """Restituisce alcune colonne del file Excel, rileggendolo solo se è cambiato.
+
+    Lo stesso DataFrame serve per l'elenco mostrato nella scheda e per la
+    generazione: chi lo usa non deve modificarlo.
+
+    Args:
+        path: Percorso del file Excel
+        colonne: Nomi delle colonne da leggere (quelle assenti vengono ignorate)
+        dtype: str per leggere tutti i valori come testo
+
+    Returns:
+        pd.DataFrame: Colonne lette dal file
+    """
+    st = Path(path).stat()
+    return _colonne_in_cache(str(path), st.st_mtime_ns, st.st_size, colonne, dtype)
+
+
+def leggi_dati_etichette_naz(path) -> pd.DataFrame:
+    """Restituisce come testo le colonne usate dalle Etichette Naz."""
+    return leggi_colonne_file(path, _COLONNE_ETICHETTE_NAZ, dtype=str)
+
+
+def leggi_dati_etichette_interne(path) -> pd.DataFrame:
+    """Restituisce le colonne usate dalle Etichette Interne."""
+    return leggi_colonne_file(path, _COLONNE_ETICHETTE_INTERNE)
+
+
+# Widget che gestiscono da soli la rotella del mouse (binding di classe Tk)
+_CLASSI_SCROLL_NATIVO = frozenset(("Treeview", "Listbox", "Text"))
+
+
+def _installa_dispatcher_rotella(root):
+    """Registra un unico gestore globale della rotella del mouse.
+
+    Il gestore individua il widget sotto il cursore e risale la gerarchia fino
+    al primo canvas registrato con bind_mousewheel_to_canvas, che è l'unico a
+    scorrere: con canvas annidati non si hanno più scroll doppi.
+
+    Args:
+        root: La finestra principale dell'applicazione
     """
+    if getattr(root, '_mw_dispatcher_installato', False):
+        return
+    root._mw_dispatcher_installato = True
+
     def _on_mousewheel(event):
+        try:
+            widget = root.winfo_containing(event.x_root, event.y_root)
+        except (KeyError, tk.TclError):
+            # Widget interni di Tk (es. popup delle combobox) non noti a tkinter
+            return
+
+        while widget is not None:
+            if widget.winfo_class() in _CLASSI_SCROLL_NATIVO:
+                return
+            canvas = getattr(widget, '_mw_scroll_target', None)
+            if canvas is not None:
+                break
+            widget = widget.master
+        else:
+            return
+
         # Verifica che ci sia effettivamente contenuto scrollabile
-        bbox = canvas.bbox("all")
-        if bbox:
-            # Ottieni la posizione corrente della scrollbar
-            current_view = canvas.yview()
-
-            # Calcola lo scroll richiesto
-            scroll_amount = int(-1*(event.delta/120))
-
-            # Previeni lo scrolling oltre i limiti
-            if scroll_amount < 0 and current_view[0] <= 0:
-                # Già al top, non scrollare verso l'alto
-                return "break"
-            elif scroll_amount > 0 and current_view[1] >= 1.0:
-                # Già al bottom, non scrollare verso il basso
-                return "break"
-
-            canvas.yview_scroll(scroll_amount, "units")
+        if not canvas.bbox("all"):
+            return "break"
+
+        # Ottieni la posizione corrente della scrollbar
+        current_view = canvas.yview()
+
+        # Calcola lo scroll richiesto
+        scroll_amount = int(-1*(event.delta/120))
+
+        # Previeni lo scrolling oltre i limiti
+        if scroll_amount < 0 and current_view[0] <= 0:
+            # Già al top, non scrollare verso l'alto
+            return "break"
+        elif scroll_amount > 0 and current_view[1] >= 1.0:
+            # Già al bottom, non scrollare verso il basso
+            return "break"
+
+        canvas.yview_scroll(scroll_amount, "units")
         return "break"
 
-    # Binding diretto al canvas
-    canvas.bind("<MouseWheel>", _on_mousewheel)
+    root.bind_all("<MouseWheel>", _on_mousewheel)
+    # Combobox e spinbox cambierebbero valore con la rotella durante lo scroll
+    # del modulo: la rotella su di essi fa scorrere il canvas che li contiene
+    for classe in ("TCombobox", "TSpinbox"):
+        root.bind_class(classe, "<MouseWheel>", "")
+
+
+def bind_mousewheel_to_canvas(canvas):
+    """Aggiunge il supporto per la rotella del mouse a un canvas scrollabile.
+
+    Il canvas viene solo marcato come destinazione dello scroll; gli eventi
+    sono gestiti dal dispatcher globale installato alla prima chiamata.
+
+    Args:
+        canvas: Il canvas a cui aggiungere il supporto per la rotella del mouse
+    """
+    canvas._mw_scroll_target = canvas
+    _installa_dispatcher_rotella(canvas._root())
+
+
+def riempi_treeview(tree, righe):
+    """Sostituisce tutte le righe di una Treeview con un unico script Tcl.
+
+    Args:
+        tree: Treeview (show="tree") da riempire
+        righe: Coppie (iid, testo) nell'ordine di visualizzazione; gli iid ripetuti vengono saltati
+    """
+    call = tree.tk.call
+    w = tree._w
+    nome_var = f"::_righe{w}"
+    call('set', nome_var, tuple(valore for riga in righe for valore in riga))
+    call('eval',
+         f"{w} delete [{w} children {{}}]; "
+         f"foreach {{i t}} ${{{nome_var}}} "
+         f"{{ if {{![{w} exists $i]}} {{ {w} insert {{}} end -id $i -text $t }} }}; "
+         f"unset {{{nome_var}}}")
+
+
+def alterna_selezione_riga(event):
+    """Click su una Treeview: alterna la selezione della riga cliccata, come una checkbox."""
+    tree = event.widget
+    iid = tree.identify_row(event.y)
+    if iid:
+        tree.focus(iid)
+        tree.selection_toggle(iid)
+    return "break"
+
+
+class _SchedaFileMixin:
+    """Comportamenti comuni alle schede che leggono un file di input e generano un output.
+
+    La scheda definisce notebook, frame, app_context, leggi_file_condiviso e,
+    dopo create_widgets, generate_button, progress e update_button_state.
+    """
+
+    def _init_scheda(self):
+        """Inizializza lo stato condiviso (da chiamare all'inizio di __init__)."""
+        # Incrementato a ogni lettura asincrona: i risultati superati vengono scartati
+        self._load_id = 0
+        # after() in attesa per il ricalcolo della scrollregion
+        self._scroll_update_pending = None
+        self._built = True
+        # True dall'invio della generazione al suo completamento: nel frattempo
+        # bottone e barra di avanzamento appartengono alla generazione
+        self._generazione_in_corso = False
+
+    def _costruisci_alla_prima_visualizzazione(self):
+        """Rimanda create_widgets a quando la scheda viene mostrata (o serve un file)."""
+        self._built = False
+        self.notebook.bind("<<NotebookTabChanged>>", self._maybe_build, add="+")
+
+    def _maybe_build(self, event=None):
+        """Crea i widget quando la scheda viene mostrata la prima volta."""
+        if not self._built and self.notebook.select() == str(self.frame):
+            self._build()
+
+    def _build(self):
+        """Crea i widget della scheda (una sola volta)."""
+        if self._built:
+            return
+        self._built = True
+        self.create_widgets()
+
+    def _pianifica_scrollregion(self, canvas):
+        """Ricalcola la scrollregion del canvas; le richieste ravvicinate (es. durante
+        il resize) vengono raggruppate in un solo ricalcolo ogni 16 ms."""
+        if self._scroll_update_pending is None:
+            self._scroll_update_pending = self.frame.after(16, self._aggiorna_scrollregion, canvas)
+
+    def _aggiorna_scrollregion(self, canvas):
+        self._scroll_update_pending = None
+        # Aggiorna la scrollregion basandosi sul contenuto effettivo
+        canvas.configure(scrollregion=canvas.bbox("all"))
+        # Reset alla posizione iniziale se necessario
+        if canvas.yview()[0] < 0:
+            canvas.yview_moveto(0)
+
+    def _carica_file_async(self, path, on_done, on_err):
+        """
+        Legge il file con leggi_file_condiviso nel pool di thread senza bloccare l'interfaccia.
+
+        Durante la lettura la barra di avanzamento è animata e il bottone di
+        generazione è disabilitato; on_done/on_err vengono eseguite nel thread Tk.
+        """
+        self._load_id += 1
+        load_id = self._load_id
+
+        self.generate_button.state(['disabled'])
+        if not self._generazione_in_corso:
+            self.progress.configure(mode='indeterminate')
+            self.progress.start()
+        future = self.app_context._executor.submit(self.leggi_file_condiviso, path)
+
+        def controlla_completamento():
+            if not future.done():
+                self.frame.after(50, controlla_completamento)
+                return
+            if load_id != self._load_id:
+                # Nel frattempo è stato scelto un altro file
+                return
+
+            self._ferma_progresso()
+            if future.exception() is None:
+                on_done(future.result())
+            else:
+                on_err(future.exception())
+            self.update_button_state()
+
+        self.frame.after(50, controlla_completamento)
+
+    def _annulla_caricamento(self):
+        """Scarta un'eventuale lettura asincrona ancora in corso."""
+        self._load_id += 1
+        self._ferma_progresso()
+
+    def _ferma_progresso(self):
+        """Ferma la barra di avanzamento, se non è in uso dalla generazione."""
+        if not self._generazione_in_corso:
+            self.progress.stop()
+
+    def update_button_state(self):
+        """Abilita il bottone GENERA solo se input e output sono impostati"""
+        if self._generazione_in_corso:
+            # Il bottone resta disabilitato finché la generazione non è terminata
+            return
+        if self._input_output_impostati():
+            self.generate_button.state(['!disabled'])
+        else:
+            self.generate_button.state(['disabled'])
+
+    def _segui_generazione(self, future, on_completata, intervallo=100, on_attesa=None):
+        """
+        Attende nel thread Tk la fine di una generazione inviata al pool di thread.
+
+        Args:
+            future: Future della generazione appena inviata
+            on_completata: Riceve il future terminato, dopo il ripristino di bottone e barra
+            intervallo: Millisecondi tra un controllo e il successivo
+            on_attesa: Chiamata a ogni controllo (es. per aggiornare la percentuale)
+        """
+        self._generazione_in_corso = True
+
+        def controlla_completamento():
+            if on_attesa is not None:
+                on_attesa()
+            if not future.done():
+                self.frame.after(intervallo, controlla_completamento)
+                return
+
+            self._generazione_in_corso = False
+            self.progress.stop()
+            self.update_button_state()
+            on_completata(future)
+
+        self.frame.after(intervallo, controlla_completamento)
+
+    def _carica_file(self, path, dati, errore, on_done, on_err):
+        """
+        Applica il risultato di una lettura già eseguita (es. per il file condiviso)
+        oppure, se non è disponibile, legge il file in modo asincrono.
+
+        Args:
+            path: File da leggere se dati ed errore sono None
+            dati: Risultato di leggi_file_condiviso già disponibile
+            errore: Eccezione sollevata dalla lettura già eseguita
+            on_done: Riceve i dati letti
+            on_err: Riceve l'eccezione
+        """
+        if dati is None and errore is None:
+            self._carica_file_async(path, on_done, on_err)
+            return
+
+        self._annulla_caricamento()
+        if errore is None:
+            on_done(dati)
+        else:
+            on_err(errore)
+        self.update_button_state()
+
+
+class _SchedaDescrizioniMixin(_SchedaFileMixin):
+    """Schede con la lista delle descrizioni del file di input (self.desc_tree)."""
+
+    def leggi_file_condiviso(self, file_path):
+        """Legge le descrizioni dal file condiviso (non tocca i widget)."""
+        return leggi_descrizioni_file(file_path)
 
-    # Funzione per propagare il binding ai widget figli
-    def _bind_all_children(widget):
-        widget.bind("<MouseWheel>", _on_mousewheel)
-        for child in widget.winfo_children():
-            _bind_all_children(child)
+    def select_all_descriptions(self):
+        """Seleziona tutte le descrizioni"""
+        self.desc_tree.selection_set(self.desc_tree.get_children())
+
+    def deselect_all_descriptions(self):
+        """Deseleziona tutte le descrizioni"""
+        self.desc_tree.selection_set(())
 
-    # Ritarda il binding dei figli per assicurarsi che siano già creati
-    canvas.after(100, lambda: _bind_all_children(canvas))
+    def load_descriptions(self, descriptions):
+        """Carica le descrizioni disponibili nella lista (l'iid di ogni riga è la descrizione)."""
+        riempi_treeview(self.desc_tree, ((d, d) for d in descriptions))
 
 
 # ============================================================================
@@ -68,6 +405,9 @@ def bind_mousewheel_to_canvas(canvas):
 class InterfacciaGeneratoreExcel:
     """Interfaccia grafica principale per la generazione di documenti Excel."""
 
+    # Gli stili ttk sono globali: vengono configurati una sola volta per processo
+    _styles_configured = False
+
     def __init__(self, root):
         """Inizializza l'interfaccia grafica."""
         self.root = root
@@ -87,6 +427,8 @@ class InterfacciaGeneratoreExcel:
         # Directory per i preset di componenti
         self.preset_dir = Path("DB/preset_componenti")
         self.preset_dir.mkdir(parents=True, exist_ok=True)
+        # Hash del contenuto dei preset salvati in questa sessione {Path: str}
+        self._preset_hashes: Dict[Path, str] = {}
 
         self.input_file = None
         self.csv_reg_input_file = None
@@ -106,6 +448,14 @@ class InterfacciaGeneratoreExcel:
         self.etichetteword_tab = None
         self.merge_doc_tab = None
 
+        # Schede che ricevono il file di input condiviso: (lettura, applicazione).
+        # La lettura del file gira in un thread, l'applicazione sui widget nel thread Tk
+        self._file_subscribers: List[Tuple[Callable[[str], Any],
+                                           Callable[[str, Any, Optional[BaseException]], None]]] = []
+        # Incrementato a ogni pubblicazione: i risultati superati vengono scartati
+        self._pubblicazione_id = 0
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
         self._crea_menu()
         self._crea_interfaccia()
 
@@ -120,6 +470,9 @@ class InterfacciaGeneratoreExcel:
 
     def _crea_interfaccia(self):
         """Crea l'interfaccia principale con notebook."""
+        # Stili e font condivisi devono esistere prima della creazione dei widget
+        self._configura_stile()
+
         # Frame header con logo in alto a destra
         header_frame = ttk.Frame(self.root)
         header_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
@@ -218,8 +571,51 @@ class InterfacciaGeneratoreExcel:
         self.etichetteword_tab = EtichetteWordTab(self.notebook, self)
         self.merge_doc_tab = MergeDocTab(self.notebook, self)
 
+        for tab in (self.csv_reg_tab, self.import_gestionale_tab, self.etichettebox_tab,
+                    self.etichettepdf_tab, self.etichetteword_tab):
+            if tab:
+                self._registra_file_subscriber(tab.leggi_file_condiviso, tab.load_shared_input_file)
 
-        self._configura_stile()
+    def _registra_file_subscriber(self, leggi: Callable[[str], Any],
+                                  applica: Callable[[str, Any, Optional[BaseException]], None]):
+        """
+        Registra una scheda che deve ricevere il file di input condiviso.
+
+        Args:
+            leggi (Callable): Legge i dati dal file (eseguita in un thread, senza widget)
+            applica (Callable): Aggiorna la scheda con il file, i dati letti e l'eventuale errore
+        """
+        self._file_subscribers.append((leggi, applica))
+
+    def _pubblica_file_condiviso(self, file_path: str, titolo: str, messaggio: str):
+        """
+        Notifica il file condiviso a tutte le schede registrate.
+
+        La lettura del file avviene in parallelo nel pool di thread; quando tutte
+        le letture sono terminate le schede vengono aggiornate nel thread Tk e
+        viene mostrato il messaggio finale.
+        """
+        self._pubblicazione_id += 1
+        pubblicazione_id = self._pubblicazione_id
+        futures = [(self._executor.submit(leggi, file_path), applica)
+                   for leggi, applica in self._file_subscribers]
+
+        def controlla_completamento():
+            if pubblicazione_id != self._pubblicazione_id:
+                # Nel frattempo è stato pubblicato un altro file
+                return
+            if not all(future.done() for future, _ in futures):
+                self.root.after(100, controlla_completamento)
+                return
+
+            for future, applica in futures:
+                # In caso di errore la scheda mostra l'errore senza rileggere il file
+                errore = future.exception()
+                applica(file_path, future.result() if errore is None else None, errore)
+
+            messagebox.showinfo(titolo, messaggio)
+
+        self.root.after(100, controlla_completamento)
 
     def _crea_sezione_file_input_condiviso(self, parent, row_start: int):
         """Crea la sezione per la selezione del file di input condiviso."""
@@ -257,8 +653,9 @@ class InterfacciaGeneratoreExcel:
     def _seleziona_file_input_condiviso(self):
         """Seleziona il file di input condiviso."""
         filename = filedialog.askopenfilename(
+            parent=self.root,
             title="Seleziona file Excel di input condiviso",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=EXCEL_FILETYPES
         )
 
         if filename:
@@ -268,18 +665,8 @@ class InterfacciaGeneratoreExcel:
                 foreground="green"
             )
 
-            if self.csv_reg_tab:
-                self.csv_reg_tab.load_shared_input_file(filename)
-            if self.import_gestionale_tab:
-                self.import_gestionale_tab.load_shared_input_file(filename)
-            if self.etichettebox_tab:
-                self.etichettebox_tab.load_shared_input_file(filename)
-            if self.etichettepdf_tab:
-                self.etichettepdf_tab.load_shared_input_file(filename)
-            if self.etichetteword_tab:
-                self.etichetteword_tab.load_shared_input_file(filename)
-
-            messagebox.showinfo(
+            self._pubblica_file_condiviso(
+                filename,
                 "File Caricato",
                 f"Il file '{Path(filename).name}' è stato caricato in tutte le schede."
             )
@@ -674,6 +1061,99 @@ class InterfacciaGeneratoreExcel:
             del self.componenti_selezionati[nome_componente]
             self._aggiorna_lista_componenti()
 
+    def _lista_file_preset(self) -> List[Path]:
+        """Restituisce i file preset presenti su disco (escluso l'indice)."""
+        return [p for p in self.preset_dir.glob("*.json") if p.name != PRESET_INDEX_FILE]
+
+    def _leggi_preset(self, preset_file: Path) -> Dict:
+        """Legge il contenuto completo di un file preset."""
+        return _fastjson.loads(preset_file.read_bytes())
+
+    def _voce_indice_preset(self, preset_file: Path, preset_data: Dict) -> Dict:
+        """Costruisce la voce dell'indice preset per un file."""
+        componenti = preset_data.get('componenti', [])
+        return {
+            'file': preset_file.name,
+            'nome': preset_data.get('nome', preset_file.stem),
+            'data': preset_data.get('data_creazione', 'N/A'),
+            'n_componenti': len(componenti) if isinstance(componenti, list) else len(componenti.keys()),
+            'mtime': preset_file.stat().st_mtime
+        }
+
+    def _salva_indice_preset(self, indice: List[Dict]):
+        """Salva l'indice dei preset su file."""
+        try:
+            (self.preset_dir / PRESET_INDEX_FILE).write_bytes(_fastjson.dumps(indice, indent=True))
+        except Exception as e:
+            print(f"Errore nel salvataggio dell'indice preset: {e}")
+
+    def _ricostruisci_indice_preset(self) -> List[Dict]:
+        """Ricostruisce l'indice leggendo tutti i file preset e lo salva."""
+        indice = []
+        for preset_file in self._lista_file_preset():
+            try:
+                indice.append(self._voce_indice_preset(preset_file, self._leggi_preset(preset_file)))
+            except Exception as e:
+                print(f"Errore nel caricare {preset_file}: {e}")
+        self._salva_indice_preset(indice)
+        return indice
+
+    def _leggi_indice_preset(self) -> Optional[List[Dict]]:
+        """Legge l'indice dei preset così com'è su disco, None se manca o non è valido."""
+        try:
+            indice = _fastjson.loads((self.preset_dir / PRESET_INDEX_FILE).read_bytes())
+        except (OSError, ValueError):
+            return None
+        return indice if isinstance(indice, list) else None
+
+    def _carica_indice_preset(self) -> List[Dict]:
+        """
+        Restituisce l'indice dei preset ordinato per data di modifica (più recenti prima).
+
+        L'indice evita di aprire tutti i file preset solo per mostrarne l'elenco;
+        se manca o non corrisponde ai file presenti su disco viene ricostruito.
+
+        Returns:
+            List[Dict]: Voci con 'file', 'nome', 'data', 'n_componenti', 'mtime'
+        """
+        mtimes = {p.name: p.stat().st_mtime for p in self._lista_file_preset()}
+        indice = self._leggi_indice_preset()
+
+        if indice is None or {v.get('file'): v.get('mtime') for v in indice} != mtimes:
+            indice = self._ricostruisci_indice_preset()
+
+        return sorted(indice, key=lambda v: v['mtime'], reverse=True)
+
+    def _aggiorna_indice_preset(self, preset_file: Path, preset_data: Optional[Dict] = None):
+        """
+        Aggiorna la voce di un preset nell'indice.
+
+        Viene chiamata dopo aver scritto o eliminato il file, quindi l'indice su
+        disco non viene confrontato con i file presenti: si sostituisce solo la
+        voce del preset (l'indice viene ricostruito solo se manca o non è valido).
+
+        Args:
+            preset_file (Path): File del preset salvato o eliminato
+            preset_data (Optional[Dict]): Contenuto del preset, None se eliminato
+        """
+        indice = self._leggi_indice_preset()
+        if indice is None:
+            self._ricostruisci_indice_preset()
+            return
+
+        indice = [v for v in indice if v.get('file') != preset_file.name]
+        if preset_data is not None:
+            indice.append(self._voce_indice_preset(preset_file, preset_data))
+        self._salva_indice_preset(indice)
+
+    @staticmethod
+    def _hash_preset(nome_preset: str, componenti: List[Dict]) -> str:
+        """Calcola un hash del contenuto di un preset (nome e componenti)."""
+        chiave = (nome_preset, tuple(
+            (c['nome'], c['quantita'], repr(c['inizio_indicizzazione_prefisso'])) for c in componenti
+        ))
+        return hashlib.blake2b(repr(chiave).encode('utf-8'), digest_size=16).hexdigest()
+
     def _salva_preset_componenti(self):
         """Salva la lista corrente di componenti come preset."""
         if not self.componenti_selezionati:
@@ -742,8 +1222,28 @@ class InterfacciaGeneratoreExcel:
 
             preset_file = self.preset_dir / f"{nome_preset_safe}.json"
 
+            # Salva i componenti con quantità e inizio_indicizzazione_prefisso
+            componenti_da_salvare = []
+            print("DEBUG SALVA PRESET: Preparazione dati da salvare...")
+            for nome_comp, dati_comp in self.componenti_selezionati.items():
+                comp_dict = {
+                    'nome': nome_comp,
+                    'quantita': dati_comp.get('quantita', 1),
+                    'inizio_indicizzazione_prefisso': dati_comp.get('inizio_indicizzazione_prefisso')
+                }
+                print(f"  {nome_comp}: quantita={comp_dict['quantita']}, inizio_indic={comp_dict['inizio_indicizzazione_prefisso']}")
+                componenti_da_salvare.append(comp_dict)
+
+            nuovo_hash = self._hash_preset(nome_preset, componenti_da_salvare)
+
             # Verifica se esiste già
             if preset_file.exists():
+                # Stesso contenuto già salvato: nessuna scrittura necessaria
+                if self._preset_hashes.get(preset_file) == nuovo_hash:
+                    messagebox.showinfo("Nessuna modifica", f"Il preset '{nome_preset}' è già aggiornato")
+                    finestra_salva.destroy()
+                    return
+
                 risposta = messagebox.askyesno(
                     "Preset Esistente",
                     f"Il preset '{nome_preset_safe}' esiste già. Vuoi sovrascriverlo?"
@@ -752,26 +1252,16 @@ class InterfacciaGeneratoreExcel:
                     return
 
             try:
-                # Salva i componenti con quantità e inizio_indicizzazione_prefisso
-                componenti_da_salvare = []
-                print("DEBUG SALVA PRESET: Preparazione dati da salvare...")
-                for nome_comp, dati_comp in self.componenti_selezionati.items():
-                    comp_dict = {
-                        'nome': nome_comp,
-                        'quantita': dati_comp.get('quantita', 1),
-                        'inizio_indicizzazione_prefisso': dati_comp.get('inizio_indicizzazione_prefisso')
-                    }
-                    print(f"  {nome_comp}: quantita={comp_dict['quantita']}, inizio_indic={comp_dict['inizio_indicizzazione_prefisso']}")
-                    componenti_da_salvare.append(comp_dict)
-
                 preset_data = {
                     'nome': nome_preset,
                     'data_creazione': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                     'componenti': componenti_da_salvare
                 }
 
-                with open(preset_file, 'w', encoding='utf-8') as f:
-                    json.dump(preset_data, f, indent=2, ensure_ascii=False)
+                preset_file.write_bytes(_fastjson.dumps(preset_data, indent=True))
+                self._preset_hashes[preset_file] = nuovo_hash
+
+                self._aggiorna_indice_preset(preset_file, preset_data)
 
                 print(f"DEBUG SALVA PRESET: Preset salvato in {preset_file}")
 
@@ -795,10 +1285,10 @@ class InterfacciaGeneratoreExcel:
 
     def _carica_preset_componenti(self):
         """Carica un preset di componenti salvato."""
-        # Ottieni tutti i preset disponibili
-        preset_files = list(self.preset_dir.glob("*.json"))
+        # Ottieni tutti i preset disponibili dall'indice
+        indice_preset = self._carica_indice_preset()
 
-        if not preset_files:
+        if not indice_preset:
             messagebox.showinfo("Info", "Nessun preset salvato trovato")
             return
 
@@ -826,22 +1316,12 @@ class InterfacciaGeneratoreExcel:
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=listbox.yview)
 
-        # Carica info preset
+        # Carica info preset (il contenuto completo viene letto solo per il preset scelto)
         preset_info_list = []
-        for preset_file in sorted(preset_files, key=lambda x: x.stat().st_mtime, reverse=True):
-            try:
-                with open(preset_file, 'r', encoding='utf-8') as f:
-                    preset_data = json.load(f)
-                    nome = preset_data.get('nome', preset_file.stem)
-                    data = preset_data.get('data_creazione', 'N/A')
-                    componenti = preset_data.get('componenti', [])
-                    num_componenti = len(componenti) if isinstance(componenti, list) else len(componenti.keys())
-
-                    display_text = f"{nome} - {num_componenti} componenti - {data}"
-                    listbox.insert(tk.END, display_text)
-                    preset_info_list.append((preset_file, preset_data))
-            except Exception as e:
-                print(f"Errore nel caricare {preset_file}: {e}")
+        for voce in indice_preset:
+            display_text = f"{voce['nome']} - {voce['n_componenti']} componenti - {voce['data']}"
+            listbox.insert(tk.END, display_text)
+            preset_info_list.append(self.preset_dir / voce['file'])
 
         def carica():
             selezione = listbox.curselection()
@@ -849,7 +1329,12 @@ class InterfacciaGeneratoreExcel:
                 messagebox.showwarning("Attenzione", "Seleziona un preset da caricare")
                 return
 
-            preset_file, preset_data = preset_info_list[selezione[0]]
+            preset_file = preset_info_list[selezione[0]]
+            try:
+                preset_data = self._leggi_preset(preset_file)
+            except Exception as e:
+                messagebox.showerror("Errore", f"Errore nel caricare il preset: {str(e)}")
+                return
 
             # Chiedi conferma se ci sono già componenti selezionati
             if self.componenti_selezionati:
@@ -874,10 +1359,8 @@ class InterfacciaGeneratoreExcel:
                     componenti_preset = [{'nome': nome, 'quantita': 1, 'inizio_indicizzazione_prefisso': None}
                                         for nome in componenti_preset.keys()]
 
-                # Svuota i componenti selezionati
-                self.componenti_selezionati.clear()
-
-                # Carica ogni componente dal database
+                # Costruisce la nuova selezione e la sostituisce a quella corrente in un colpo solo
+                nuovi_selezionati = {}
                 componenti_non_trovati = []
                 for comp_preset in componenti_preset:
                     # Gestisci sia il nuovo formato (dict) che il vecchio (string)
@@ -893,7 +1376,7 @@ class InterfacciaGeneratoreExcel:
                     comp_info = self.gestore_componenti.cerca_componente_per_nome(nome_comp)
                     if comp_info:
                         # Popola con i dati dal preset, usando il database solo per sn_iniziale
-                        self.componenti_selezionati[nome_comp] = {
+                        nuovi_selezionati[nome_comp] = {
                             'quantita': quantita_preset,
                             'sn_iniziale_override': comp_info.get('sn_iniziale'),
                             'inizio_indicizzazione_prefisso': inizio_indic_preset
@@ -901,6 +1384,8 @@ class InterfacciaGeneratoreExcel:
                     else:
                         componenti_non_trovati.append(nome_comp)
 
+                self.componenti_selezionati = nuovi_selezionati
+
                 # DEBUG: Stampa i componenti caricati
                 print("DEBUG CARICA PRESET: Componenti caricati:")
                 for nome, dati in self.componenti_selezionati.items():
@@ -913,9 +1398,11 @@ class InterfacciaGeneratoreExcel:
                 if componenti_non_trovati:
                     messagebox.showwarning(
                         "Preset Caricato con Avvisi",
-                        f"Preset '{preset_data.get('nome')}' caricato.\n\n" +
-                        f"Componenti non trovati nel database:\n" +
-                        "\n".join(f"- {c}" for c in componenti_non_trovati)
+                        "\n".join([
+                            f"Preset '{preset_data.get('nome')}' caricato.", "",
+                            "Componenti non trovati nel database:",
+                            *(f"- {c}" for c in componenti_non_trovati)
+                        ])
                     )
                 else:
                     messagebox.showinfo(
@@ -943,9 +1430,7 @@ class InterfacciaGeneratoreExcel:
 
     def _gestisci_preset_componenti(self):
         """Finestra per gestire (visualizzare, rinominare, eliminare) i preset salvati."""
-        preset_files = list(self.preset_dir.glob("*.json"))
-
-        if not preset_files:
+        if not self._lista_file_preset():
             messagebox.showinfo("Info", "Nessun preset salvato trovato")
             return
 
@@ -992,17 +1477,9 @@ class InterfacciaGeneratoreExcel:
             listbox.delete(0, tk.END)
             preset_info_list.clear()
 
-            preset_files = list(self.preset_dir.glob("*.json"))
-            for preset_file in sorted(preset_files, key=lambda x: x.stat().st_mtime, reverse=True):
-                try:
-                    with open(preset_file, 'r', encoding='utf-8') as f:
-                        preset_data = json.load(f)
-                        nome = preset_data.get('nome', preset_file.stem)
-
-                        listbox.insert(tk.END, nome)
-                        preset_info_list.append((preset_file, preset_data))
-                except Exception as e:
-                    print(f"Errore nel caricare {preset_file}: {e}")
+            for voce in self._carica_indice_preset():
+                listbox.insert(tk.END, voce['nome'])
+                preset_info_list.append((self.preset_dir / voce['file'], voce['nome']))
 
         # Funzione per mostrare dettagli
         def mostra_dettagli(event=None):
@@ -1010,10 +1487,12 @@ class InterfacciaGeneratoreExcel:
             if not selezione:
                 return
 
-            preset_file, preset_data = preset_info_list[selezione[0]]
-
-            text_dettagli.config(state=tk.NORMAL)
-            text_dettagli.delete(1.0, tk.END)
+            preset_file, _ = preset_info_list[selezione[0]]
+            try:
+                preset_data = self._leggi_preset(preset_file)
+            except Exception as e:
+                print(f"Errore nel caricare {preset_file}: {e}")
+                return
 
             nome = preset_data.get('nome', 'N/A')
             data = preset_data.get('data_creazione', 'N/A')
@@ -1033,29 +1512,29 @@ class InterfacciaGeneratoreExcel:
                 # Nuovo formato: lista di dict
                 componenti_normalizzati = componenti
 
-            dettagli = f"Nome: {nome}\n\n"
-            dettagli += f"Data creazione: {data}\n\n"
-            dettagli += f"Numero componenti: {len(componenti_normalizzati)}\n\n"
-            dettagli += "Componenti:\n"
+            righe = [f"Nome: {nome}", "", f"Data creazione: {data}", "",
+                     f"Numero componenti: {len(componenti_normalizzati)}", "", "Componenti:"]
 
             for comp in componenti_normalizzati:
                 nome_comp = comp.get('nome') if isinstance(comp, dict) else comp
                 quantita = comp.get('quantita') if isinstance(comp, dict) else None
                 inizio_indic = comp.get('inizio_indicizzazione_prefisso') if isinstance(comp, dict) else None
 
-                dettagli += f"  - {nome_comp}"
-                if quantita is not None:
-                    dettagli += f" (Quantità: {quantita}"
-                    if inizio_indic is not None:
-                        dettagli += f", Inizio Indic: {inizio_indic}"
-                    dettagli += ")"
-                dettagli += "\n"
+                if quantita is None:
+                    righe.append(f"  - {nome_comp}")
+                elif inizio_indic is None:
+                    righe.append(f"  - {nome_comp} (Quantità: {quantita})")
+                else:
+                    righe.append(f"  - {nome_comp} (Quantità: {quantita}, Inizio Indic: {inizio_indic})")
 
             if any(comp.get('quantita') is None for comp in componenti_normalizzati if isinstance(comp, dict)):
-                dettagli += "\n(Quantità e Inizio Indic. verranno caricati dal database per i preset vecchi)"
+                righe.append("\n(Quantità e Inizio Indic. verranno caricati dal database per i preset vecchi)")
 
-            text_dettagli.insert(1.0, dettagli)
-            text_dettagli.config(state=tk.DISABLED)
+            # Un solo insert con il testo completo; lo stato viene impostato via attributo
+            text_dettagli['state'] = tk.NORMAL
+            text_dettagli.delete(1.0, tk.END)
+            text_dettagli.insert(1.0, "\n".join(righe))
+            text_dettagli['state'] = tk.DISABLED
 
         preset_info_list = []
         carica_lista()
@@ -1071,8 +1550,7 @@ class InterfacciaGeneratoreExcel:
                 messagebox.showwarning("Attenzione", "Seleziona un preset da eliminare")
                 return
 
-            preset_file, preset_data = preset_info_list[selezione[0]]
-            nome = preset_data.get('nome', preset_file.stem)
+            preset_file, nome = preset_info_list[selezione[0]]
 
             risposta = messagebox.askyesno(
                 "Conferma Eliminazione",
@@ -1082,6 +1560,8 @@ class InterfacciaGeneratoreExcel:
             if risposta:
                 try:
                     preset_file.unlink()
+                    self._preset_hashes.pop(preset_file, None)
+                    self._aggiorna_indice_preset(preset_file)
                     messagebox.showinfo("Successo", f"Preset '{nome}' eliminato")
                     carica_lista()
                     text_dettagli.config(state=tk.NORMAL)
@@ -1178,8 +1658,9 @@ class InterfacciaGeneratoreExcel:
                 })
 
         nome_file = filedialog.asksaveasfilename(
+            parent=self.root,
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+            filetypes=EXCEL_FILETYPES,
             initialfile="documento_componenti.xlsx"
         )
 
@@ -1231,18 +1712,8 @@ class InterfacciaGeneratoreExcel:
                 foreground="green"
             )
 
-            if self.csv_reg_tab:
-                self.csv_reg_tab.load_shared_input_file(file_generato)
-            if self.import_gestionale_tab:
-                self.import_gestionale_tab.load_shared_input_file(file_generato)
-            if self.etichettebox_tab:
-                self.etichettebox_tab.load_shared_input_file(file_generato)
-            if self.etichettepdf_tab:
-                self.etichettepdf_tab.load_shared_input_file(file_generato)
-            if self.etichetteword_tab:
-                self.etichetteword_tab.load_shared_input_file(file_generato)
-
-            messagebox.showinfo(
+            self._pubblica_file_condiviso(
+                str(file_generato),
                 "Successo",
                 f"Documento generato con successo!\n\n"
                 f"File: {file_generato}\n\n"
@@ -1254,12 +1725,22 @@ class InterfacciaGeneratoreExcel:
 
     def _configura_stile(self):
         """Configura gli stili dei widget."""
+        if type(self)._styles_configured:
+            return
+
         style = ttk.Style()
         style.configure("Accent.TButton", font=("Arial", 12, "bold"), padding=10)
         style.configure("TLabelframe", padding=15, relief="solid", borderwidth=1)
         style.configure("TLabelframe.Label", font=("Arial", 11, "bold"), foreground="#2C3E50")
         style.configure("TNotebook", padding=5, tabmargins=[2, 5, 2, 0])
         style.configure("TNotebook.Tab", font=("Arial", 10, "bold"), padding=[20, 10])
+        style.configure("Detail.TLabel", font=("Arial", 10))
+        style.configure("Hint.TLabel", font=("Arial", 8), foreground="gray")
+
+        # Il font dei ttk.Entry non dipende dallo stile: si usa un font con nome condiviso
+        type(self)._font_dettagli = tkfont.Font(name="DetailFont", family="Arial", size=10)
+
+        type(self)._styles_configured = True
 
 
 # ============================================================================
@@ -1269,12 +1750,34 @@ class InterfacciaGeneratoreExcel:
 class GestioneComponentiTab:
     """Scheda dedicata alla gestione completa dei componenti (CRUD)."""
 
+    # Colonne visibili quando "Mostra dettagli" è disattivato
+    COLONNE_PRINCIPALI = ("nome", "code_12nc", "sn_iniziale", "prefisso")
+
     def __init__(self, notebook, app_context):
         self.notebook = notebook
         self.app_context = app_context
         self.gestore_componenti = app_context.gestore_componenti
         self.componente_selezionato = None
 
+        # La Treeview contiene solo le righe visibili: i dati completi restano in Python.
+        # _componenti_by_name e le colonne _col_* hanno lo stesso ordine delle righe.
+        # Le colonne contengono i testi già formattati per la Treeview (una lista per colonna)
+        self._componenti_by_name: "OrderedDict[str, Dict]" = OrderedDict()
+        self._col_nome: List[str] = []
+        self._col_code: List[str] = []
+        self._col_sn: List[str] = []
+        self._col_pref: List[str] = []
+        self._col_ii: List[str] = []
+        self._col_ind: List[str] = []
+        self._revisione_cache = None
+        # Incrementato a ogni caricamento: i risultati superati vengono scartati
+        self._caricamento_id = 0
+        self._primo_visibile = 0
+        self._righe_visibili = 20
+        self._finestra = None
+        # Applicazione della selezione in attesa (debounce della navigazione da tastiera)
+        self._pending = None
+
         self.frame = ttk.Frame(self.notebook)
         self.notebook.add(self.frame, text="Gestione Componenti")
 
@@ -1300,72 +1803,132 @@ class GestioneComponentiTab:
         frame_lista = ttk.LabelFrame(main_container, text="Componenti Esistenti", padding=15)
         frame_lista.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
 
-        # Treeview per lista componenti
-        columns = ("nome", "code_12nc", "sn_iniziale", "prefisso", "indic_prefisso", "indicizzazione")
-        self.tree = ttk.Treeview(frame_lista, columns=columns, show="headings", height=20)
+        # Treeview per lista componenti: (colonna, intestazione, larghezza)
+        colonne = (
+            ("nome", "Nome Componente", 200),
+            ("code_12nc", "CODE 12NC", 120),
+            ("sn_iniziale", "SN Iniziale", 90),
+            ("prefisso", "Prefisso Tipo", 90),
+            ("indic_prefisso", "Inizio Indic.", 90),
+            ("indicizzazione", "Indic.", 70)
+        )
+        columns = tuple(col for col, _, _ in colonne)
+        # Di default vengono mostrate solo le colonne principali (meno celle da ridisegnare)
+        self.tree = ttk.Treeview(frame_lista, columns=columns, show="headings", height=20,
+                                 displaycolumns=self.COLONNE_PRINCIPALI)
+
+        # Intestazioni e larghezze impostate con un solo script Tcl
+        w = self.tree._w
+        self.tree.tk.eval("".join(
+            f"{w} heading {col} -text {{{testo}}}\n{w} column {col} -width {larghezza}\n"
+            for col, testo, larghezza in colonne
+        ))
+
+        # La scrollbar scorre la finestra di righe mostrate, non la Treeview
+        self.scrollbar = ttk.Scrollbar(frame_lista, orient=tk.VERTICAL, command=self._on_scrollbar)
+
+        self.var_mostra_tutte = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            frame_lista,
+            text="Mostra dettagli",
+            variable=self.var_mostra_tutte,
+            command=self._toggle_columns
+        ).pack(side=tk.BOTTOM, anchor="w", pady=(5, 0))
+
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_selezione_componente)
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        for sequenza in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequenza, self._on_tree_mousewheel)
+        # La Treeview contiene solo le righe visibili: la navigazione da tastiera
+        # sposta la selezione sull'intera lista scorrendo la finestra
+        for tasto in ("Up", "Down", "Prior", "Next", "Home", "End"):
+            self.tree.bind(f"<{tasto}>", self._on_tree_tasto)
+        # Quando la scheda torna visibile ricarica la lista se il database è cambiato altrove
+        self.frame.bind("<Map>", lambda e: self._sincronizza_cache())
+
+        # Il pannello dei dettagli viene creato solo quando serve (scheda mostrata o primo utilizzo)
+        self._main_container = main_container
+        self._right_built = False
+        self.notebook.bind("<<NotebookTabChanged>>", self._maybe_build_right, add="+")
 
-        self.tree.heading("nome", text="Nome Componente")
-        self.tree.heading("code_12nc", text="CODE 12NC")
-        self.tree.heading("sn_iniziale", text="SN Iniziale")
-        self.tree.heading("prefisso", text="Prefisso Tipo")
-        self.tree.heading("indic_prefisso", text="Inizio Indic.")
-        self.tree.heading("indicizzazione", text="Indic.")
+        # Pulsanti Nuovo ed Elimina in basso, fuori dalle sezioni
+        frame_pulsanti_bottom = ttk.Frame(container)
+        frame_pulsanti_bottom.pack(pady=20)
 
-        self.tree.column("nome", width=200)
-        self.tree.column("code_12nc", width=120)
-        self.tree.column("sn_iniziale", width=90)
-        self.tree.column("prefisso", width=90)
-        self.tree.column("indic_prefisso", width=90)
-        self.tree.column("indicizzazione", width=70)
+        ttk.Button(frame_pulsanti_bottom, text="Nuovo Componente", command=self._nuovo_componente, width=20).pack(side=tk.LEFT, padx=10)
+        ttk.Button(frame_pulsanti_bottom, text="Elimina Componente", command=self._elimina_componente, width=20).pack(side=tk.LEFT, padx=10)
 
-        scrollbar = ttk.Scrollbar(frame_lista, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+    def _toggle_columns(self):
+        """Mostra o nasconde le colonne di dettaglio senza reinserire le righe."""
+        self.tree['displaycolumns'] = "#all" if self.var_mostra_tutte.get() else self.COLONNE_PRINCIPALI
 
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    def _maybe_build_right(self, event=None):
+        """Crea il pannello dei dettagli quando la scheda viene mostrata la prima volta."""
+        if not self._right_built and self.notebook.select() == str(self.frame):
+            self._build_right()
 
-        self.tree.bind("<<TreeviewSelect>>", self._on_selezione_componente)
+    def _build_right(self):
+        """Crea il pannello dei dettagli componente (una sola volta)."""
+        if self._right_built:
+            return
+        self._right_built = True
 
         # Frame destra - Dettagli componente
-        frame_dettagli = ttk.LabelFrame(main_container, text="Dettagli Componente", padding=20)
+        frame_dettagli = ttk.LabelFrame(self._main_container, text="Dettagli Componente", padding=20)
         frame_dettagli.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
+        # Variabili dei campi: impostare una variabile aggiorna il campo con una sola chiamata
+        self._vars = {
+            'nome': tk.StringVar(),
+            'code_12nc': tk.StringVar(),
+            'sn_iniziale': tk.StringVar(),
+            'prefisso': tk.StringVar(),
+            'inizio_indic': tk.StringVar()
+        }
+
         # Campo Nome
-        ttk.Label(frame_dettagli, text="Nome Componente:", font=("Arial", 10)).grid(row=0, column=0, sticky="w", pady=10)
-        self.entry_nome = ttk.Entry(frame_dettagli, width=40, font=("Arial", 10))
+        ttk.Label(frame_dettagli, text="Nome Componente:", style="Detail.TLabel").grid(row=0, column=0, sticky="w", pady=10)
+        self.entry_nome = ttk.Entry(frame_dettagli, width=40, font="DetailFont", textvariable=self._vars['nome'])
         self.entry_nome.grid(row=0, column=1, pady=10, padx=10, sticky="ew")
 
         # Campo CODE 12NC
-        ttk.Label(frame_dettagli, text="CODE 12NC:", font=("Arial", 10)).grid(row=1, column=0, sticky="w", pady=10)
-        self.entry_code_12nc = ttk.Entry(frame_dettagli, width=40, font=("Arial", 10))
+        ttk.Label(frame_dettagli, text="CODE 12NC:", style="Detail.TLabel").grid(row=1, column=0, sticky="w", pady=10)
+        self.entry_code_12nc = ttk.Entry(frame_dettagli, width=40, font="DetailFont", textvariable=self._vars['code_12nc'])
         self.entry_code_12nc.grid(row=1, column=1, pady=10, padx=10, sticky="ew")
 
         # Campo SN Iniziale
-        ttk.Label(frame_dettagli, text="SN Iniziale (opzionale):", font=("Arial", 10)).grid(row=2, column=0, sticky="w", pady=10)
-        self.entry_sn_iniziale = ttk.Entry(frame_dettagli, width=40, font=("Arial", 10))
+        ttk.Label(frame_dettagli, text="SN Iniziale (opzionale):", style="Detail.TLabel").grid(row=2, column=0, sticky="w", pady=10)
+        self.entry_sn_iniziale = ttk.Entry(frame_dettagli, width=40, font="DetailFont", textvariable=self._vars['sn_iniziale'])
         self.entry_sn_iniziale.grid(row=2, column=1, pady=10, padx=10, sticky="ew")
-        ttk.Label(frame_dettagli, text="(lascia vuoto per generazione automatica)", font=("Arial", 8), foreground="gray").grid(row=3, column=1, sticky="w", padx=10)
+        # Accetta solo cifre: il valore è sempre un intero valido (o vuoto)
+        vcmd = (self.frame.register(self._validate_int), '%P')
+        self.entry_sn_iniziale.configure(validate='key', validatecommand=vcmd)
+        ttk.Label(frame_dettagli, text="(lascia vuoto per generazione automatica)", style="Hint.TLabel").grid(row=3, column=1, sticky="w", padx=10)
 
         # Campo Prefisso
-        ttk.Label(frame_dettagli, text="Prefisso Tipo Scheda (opzionale):", font=("Arial", 10)).grid(row=4, column=0, sticky="w", pady=10)
-        self.entry_prefisso = ttk.Entry(frame_dettagli, width=40, font=("Arial", 10))
+        ttk.Label(frame_dettagli, text="Prefisso Tipo Scheda (opzionale):", style="Detail.TLabel").grid(row=4, column=0, sticky="w", pady=10)
+        self.entry_prefisso = ttk.Entry(frame_dettagli, width=40, font="DetailFont", textvariable=self._vars['prefisso'])
         self.entry_prefisso.grid(row=4, column=1, pady=10, padx=10, sticky="ew")
-        ttk.Label(frame_dettagli, text="(es: SU, CAM, RES - lascia vuoto se non necessario)", font=("Arial", 8), foreground="gray").grid(row=5, column=1, sticky="w", padx=10)
+        ttk.Label(frame_dettagli, text="(es: SU, CAM, RES - lascia vuoto se non necessario)", style="Hint.TLabel").grid(row=5, column=1, sticky="w", padx=10)
 
         # Campo Inizio Indicizzazione
-        ttk.Label(frame_dettagli, text="Inizio Indicizzazione Prefisso (opzionale):", font=("Arial", 10)).grid(row=6, column=0, sticky="w", pady=10)
-        self.entry_inizio_indic = ttk.Entry(frame_dettagli, width=40, font=("Arial", 10))
+        ttk.Label(frame_dettagli, text="Inizio Indicizzazione Prefisso (opzionale):", style="Detail.TLabel").grid(row=6, column=0, sticky="w", pady=10)
+        self.entry_inizio_indic = ttk.Entry(frame_dettagli, width=40, font="DetailFont", textvariable=self._vars['inizio_indic'])
         self.entry_inizio_indic.grid(row=6, column=1, pady=10, padx=10, sticky="ew")
-        ttk.Label(frame_dettagli, text="(numero da cui iniziare, es: 7 genera SU7, SU8, SU9...)", font=("Arial", 8), foreground="gray").grid(row=7, column=1, sticky="w", padx=10)
+        ttk.Label(frame_dettagli, text="(numero da cui iniziare, es: 7 genera SU7, SU8, SU9...)", style="Hint.TLabel").grid(row=7, column=1, sticky="w", padx=10)
 
-        # Checkbox Indicizzazione
-        self.var_indicizzazione = tk.BooleanVar(value=True)
+        # Checkbox Indicizzazione: lo stato è tenuto in self._indic (nessuna variabile Tcl)
         self.chk_indicizzazione = ttk.Checkbutton(
             frame_dettagli,
             text="Indicizzazione (aggiungi numero al tipo scheda)",
-            variable=self.var_indicizzazione
+            variable="",
+            command=self._toggle_indic
         )
         self.chk_indicizzazione.grid(row=8, column=1, sticky="w", padx=10, pady=5)
+        self._imposta_indic(True)
 
         # Pulsanti Salva/Annulla
         frame_pulsanti_dettagli = ttk.Frame(frame_dettagli)
@@ -1389,98 +1952,345 @@ class GestioneComponentiTab:
 
         frame_dettagli.grid_columnconfigure(1, weight=1)
 
-        # Pulsanti Nuovo ed Elimina in basso, fuori dalle sezioni
-        frame_pulsanti_bottom = ttk.Frame(container)
-        frame_pulsanti_bottom.pack(pady=20)
-
-        ttk.Button(frame_pulsanti_bottom, text="Nuovo Componente", command=self._nuovo_componente, width=20).pack(side=tk.LEFT, padx=10)
-        ttk.Button(frame_pulsanti_bottom, text="Elimina Componente", command=self._elimina_componente, width=20).pack(side=tk.LEFT, padx=10)
+    @staticmethod
+    def _validate_int(testo: str) -> bool:
+        """Validazione Tk: True se il testo contiene solo cifre."""
+        return _RE_INTERO.fullmatch(testo) is not None
+
+    @staticmethod
+    def _valori_riga(comp: Dict) -> tuple:
+        """Calcola i valori mostrati nella Treeview per un componente."""
+        nome, code, sn_iniziale, prefisso, inizio_indic, indic = _campi_componente(comp)
+        return (
+            nome,
+            code if code is not None else "N/A",
+            str(sn_iniziale) if sn_iniziale is not None else "Auto",
+            prefisso or "N/A",
+            str(inizio_indic) if inizio_indic is not None else "N/A",
+            "SI" if indic else "NO"
+        )
 
     def _carica_componenti(self):
-        """Carica i componenti nella Treeview."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """
+        Carica i componenti e mostra nella Treeview la porzione visibile.
 
+        La formattazione delle righe avviene nel pool di thread su una copia della
+        lista; al termine le colonne vengono sostituite alle precedenti in un solo
+        passo nel thread Tk, quindi fino ad allora la Treeview mostra i dati precedenti.
+        Se il database cambia durante la formattazione il risultato viene scartato
+        e il caricamento ripetuto.
+        """
+        # Copia della lista letta nel thread Tk: il worker non accede al gestore
         componenti = self.gestore_componenti.ottieni_tutti_componenti()
-        for comp in componenti:
-            sn_iniziale = comp.get('sn_iniziale')
-            sn_text = str(sn_iniziale) if sn_iniziale is not None else "Auto"
+        revisione = self.gestore_componenti.revisione
+        self._revisione_cache = revisione
+        self._caricamento_id += 1
+        caricamento_id = self._caricamento_id
 
-            prefisso = comp.get('prefisso_tipo_scheda', '')
-            prefisso_text = prefisso if prefisso else "N/A"
+        future = self.app_context._executor.submit(self._formatta_colonne, componenti)
 
-            inizio_indic = comp.get('inizio_indicizzazione_prefisso')
-            inizio_indic_text = str(inizio_indic) if inizio_indic is not None else "N/A"
+        def controlla_completamento():
+            if not future.done():
+                self.frame.after(50, controlla_completamento)
+                return
+            if caricamento_id != self._caricamento_id:
+                # Nel frattempo è partito un altro caricamento
+                return
+            if revisione != self.gestore_componenti.revisione:
+                self._carica_componenti()
+                return
 
-            indic = comp.get('indicizzazione', True)
-            indic_text = "SI" if indic else "NO"
+            self._componenti_by_name = OrderedDict((comp['nome'], comp) for comp in componenti)
+            (self._col_nome, self._col_code, self._col_sn,
+             self._col_pref, self._col_ii, self._col_ind) = future.result()
+            self._finestra = None
+            self._render_window(self._primo_visibile)
 
-            self.tree.insert("", tk.END, values=(
-                comp['nome'],
-                comp.get('code_12nc', 'N/A'),
-                sn_text,
-                prefisso_text,
-                inizio_indic_text,
-                indic_text
-            ))
+        self.frame.after(50, controlla_completamento)
 
-    def _on_selezione_componente(self, event):
-        """Gestisce la selezione di un componente dalla Treeview."""
-        selezione = self.tree.selection()
-        if not selezione:
-            return
+    @staticmethod
+    def _formatta_colonne(componenti: List[Dict]) -> List[List[str]]:
+        """Formatta i testi della Treeview, una lista per colonna (eseguita nel pool di thread)."""
+        colonne = [list(col) for col in zip(*map(GestioneComponentiTab._valori_riga, componenti))]
+        return colonne or [[] for _ in range(6)]
 
-        item = self.tree.item(selezione[0])
-        valori = item['values']
-        nome_componente = valori[0]
+    def _sincronizza_cache(self):
+        """Ricarica i componenti se il database è stato modificato da un'altra scheda."""
+        if self._revisione_cache != self.gestore_componenti.revisione:
+            self._carica_componenti()
 
-        comp = self.gestore_componenti.cerca_componente_per_nome(nome_componente)
-        if not comp:
-            return
+    def _render_window(self, primo: int):
+        """
+        Mostra nella Treeview solo le righe visibili a partire da 'primo'.
 
-        self.componente_selezionato = nome_componente
+        Le righe vengono reinserite solo se la finestra visibile è cambiata.
+        """
+        totale = len(self._col_nome)
+        primo = max(0, min(primo, totale - self._righe_visibili))
+        ultimo = min(totale, primo + self._righe_visibili)
+        self._primo_visibile = primo
+
+        if (primo, ultimo) != self._finestra:
+            self._finestra = (primo, ultimo)
+            self._sostituisci_righe(primo, ultimo)
+
+            # Mantieni evidenziata la riga selezionata se torna visibile
+            if self.componente_selezionato and self.tree.exists(self.componente_selezionato):
+                self.tree.selection_set(self.componente_selezionato)
+
+        self._aggiorna_scrollbar()
+
+    def _aggiorna_scrollbar(self):
+        """Allinea la scrollbar alla finestra di righe mostrata."""
+        totale = len(self._col_nome)
+        if totale and self._finestra:
+            primo, ultimo = self._finestra
+            self.scrollbar.set(primo / totale, ultimo / totale)
+        else:
+            self.scrollbar.set(0, 1)
 
-        # Popola i campi
-        self.entry_nome.delete(0, tk.END)
-        self.entry_nome.insert(0, comp['nome'])
+    def _colonne(self) -> tuple:
+        """Restituisce le colonne di testi formattati nell'ordine della Treeview."""
+        return (self._col_nome, self._col_code, self._col_sn,
+                self._col_pref, self._col_ii, self._col_ind)
 
-        self.entry_code_12nc.delete(0, tk.END)
-        self.entry_code_12nc.insert(0, comp.get('code_12nc', ''))
+    def _valori_indice(self, indice: int) -> tuple:
+        """Restituisce i valori formattati della riga in posizione 'indice'."""
+        return tuple(col[indice] for col in self._colonne())
 
-        self.entry_sn_iniziale.delete(0, tk.END)
-        sn_iniziale = comp.get('sn_iniziale')
-        if sn_iniziale is not None:
-            self.entry_sn_iniziale.insert(0, str(sn_iniziale))
+    def _indice_componente(self, nome: str) -> int:
+        """Restituisce la posizione del componente nella lista (-1 se assente)."""
+        try:
+            return self._col_nome.index(nome)
+        except ValueError:
+            return -1
+
+    def _aggiungi_riga(self, comp: Dict):
+        """Aggiunge in coda una riga senza ricaricare la Treeview."""
+        self._componenti_by_name[comp['nome']] = comp
+        for col, valore in zip(self._colonne(), self._valori_riga(comp)):
+            col.append(valore)
+
+        primo, ultimo = self._finestra or (0, 0)
+        indice = len(self._col_nome) - 1
+        # La nuova riga è visibile solo se la finestra arriva in fondo e ha spazio
+        if indice == ultimo and ultimo - primo < self._righe_visibili:
+            self.tree.insert("", tk.END, iid=comp['nome'], values=self._valori_indice(indice))
+            self._finestra = (primo, ultimo + 1)
+        self._aggiorna_scrollbar()
+
+    def _modifica_riga(self, nome_originale: str, comp: Dict):
+        """Aggiorna la riga di un componente modificato (anche se rinominato)."""
+        indice = self._indice_componente(nome_originale)
+        if indice < 0:
+            return
 
-        self.entry_prefisso.delete(0, tk.END)
-        prefisso = comp.get('prefisso_tipo_scheda', '')
-        if prefisso:
-            self.entry_prefisso.insert(0, prefisso)
+        if comp['nome'] == nome_originale:
+            self._componenti_by_name[nome_originale] = comp
+        else:
+            # Rinomina mantenendo la posizione del componente
+            self._componenti_by_name = OrderedDict(
+                (comp['nome'], comp) if k == nome_originale else (k, v)
+                for k, v in self._componenti_by_name.items()
+            )
+        for col, valore in zip(self._colonne(), self._valori_riga(comp)):
+            col[indice] = valore
 
-        self.entry_inizio_indic.delete(0, tk.END)
-        inizio_indic = comp.get('inizio_indicizzazione_prefisso')
-        if inizio_indic is not None:
-            self.entry_inizio_indic.insert(0, str(inizio_indic))
+        if not self.tree.exists(nome_originale):
+            return
+        if comp['nome'] == nome_originale:
+            self.tree.item(nome_originale, values=self._valori_indice(indice))
+        else:
+            # L'iid è il nome: per una rinomina la riga viene sostituita nella stessa posizione
+            posizione = self.tree.index(nome_originale)
+            self.tree.delete(nome_originale)
+            self.tree.insert("", posizione, iid=comp['nome'], values=self._valori_indice(indice))
+
+    def _rimuovi_riga(self, nome: str):
+        """Rimuove la riga di un componente eliminato senza ricaricare la Treeview."""
+        indice = self._indice_componente(nome)
+        if indice < 0:
+            return
 
-        indicizzazione = comp.get('indicizzazione', True)
-        self.var_indicizzazione.set(indicizzazione)
+        del self._componenti_by_name[nome]
+        for col in self._colonne():
+            del col[indice]
+
+        primo, ultimo = self._finestra or (0, 0)
+        if indice < primo:
+            # Le righe visibili scalano di una posizione
+            self._finestra = (primo - 1, ultimo - 1)
+            self._primo_visibile = primo - 1
+        elif indice < ultimo:
+            self.tree.delete(nome)
+            # La prima riga sotto la finestra scorre in vista
+            if ultimo - 1 < len(self._col_nome):
+                self.tree.insert("", tk.END, iid=self._col_nome[ultimo - 1],
+                                 values=self._valori_indice(ultimo - 1))
+            else:
+                self._finestra = (primo, ultimo - 1)
+        self._aggiorna_scrollbar()
 
-        # Abilita i pulsanti
+    def _sostituisci_righe(self, primo: int, ultimo: int):
+        """
+        Sostituisce il contenuto della Treeview con le righe da 'primo' a 'ultimo'.
+
+        Le coppie (iid, valori) vengono passate come lista Tcl in una variabile,
+        così tkinter si occupa del quoting; svuotamento e inserimento avvengono
+        in un unico script Tcl invece di una chiamata per riga.
+        """
+        righe = []
+        # L'iid di ogni riga è il nome del componente (univoco)
+        for valori in zip(*(col[primo:ultimo] for col in self._colonne())):
+            righe.extend((valori[0], valori))
+
+        call = self.tree.tk.call
+        w = self.tree._w
+        nome_var = f"::_righe_treeview{w}"
+        call('set', nome_var, tuple(righe))
+        call('eval',
+             f"{w} delete [{w} children {{}}]; "
+             f"foreach {{iid valori}} ${{{nome_var}}} "
+             f"{{ {w} insert {{}} end -id $iid -values $valori }}; "
+             f"unset {{{nome_var}}}")
+
+    def _on_scrollbar(self, *args):
+        """Gestisce i comandi della scrollbar ('moveto' o 'scroll')."""
+        if args[0] == 'moveto':
+            primo = int(float(args[1]) * len(self._col_nome))
+        else:
+            passo = int(args[1])
+            if args[2] == 'pages':
+                passo *= self._righe_visibili
+            primo = self._primo_visibile + passo
+        self._render_window(primo)
+
+    def _on_tree_mousewheel(self, event):
+        """Scorre la finestra di righe con la rotella del mouse (Button-4/5 su X11)."""
+        if event.num == 4:
+            passo = -1
+        elif event.num == 5:
+            passo = 1
+        else:
+            passo = int(-1*(event.delta/120))
+        self._render_window(self._primo_visibile + passo * 3)
+        return "break"
+
+    def _on_tree_tasto(self, event):
+        """Sposta la selezione con frecce, pagina su/giù, inizio e fine sull'intera lista."""
+        totale = len(self._col_nome)
+        if not totale:
+            return "break"
+
+        selezione = self.tree.selection()
+        nome = selezione[0] if selezione else self.componente_selezionato
+        corrente = self._indice_componente(nome) if nome else -1
+
+        if event.keysym == "Home":
+            indice = 0
+        elif event.keysym == "End":
+            indice = totale - 1
+        elif corrente < 0:
+            # Nessuna selezione: parte dalla prima riga mostrata
+            indice = self._primo_visibile
+        else:
+            passi = {"Up": -1, "Down": 1, "Prior": -self._righe_visibili, "Next": self._righe_visibili}
+            indice = corrente + passi[event.keysym]
+        indice = max(0, min(indice, totale - 1))
+
+        # Scorre la finestra solo quanto basta a mostrare la nuova riga
+        primo = self._primo_visibile
+        if indice < primo:
+            primo = indice
+        elif indice >= primo + self._righe_visibili:
+            primo = indice - self._righe_visibili + 1
+        self._render_window(primo)
+
+        nome = self._col_nome[indice]
+        self.tree.focus(nome)
+        self.tree.selection_set(nome)
+        return "break"
+
+    def _on_tree_configure(self, event):
+        """Ricalcola il numero di righe visibili quando la Treeview viene ridimensionata."""
+        altezza_riga = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        # Circa 25 pixel sono occupati dall'intestazione delle colonne
+        righe = max(1, (event.height - 25) // altezza_riga)
+        if righe != self._righe_visibili:
+            self._righe_visibili = righe
+            self._render_window(self._primo_visibile)
+
+    def _on_selezione_componente(self, event):
+        """
+        Gestisce la selezione di un componente dalla Treeview.
+
+        Le selezioni ravvicinate (es. frecce tenute premute) vengono accorpate:
+        i campi di dettaglio vengono aggiornati solo per l'ultima.
+        """
+        if self._pending:
+            self.frame.after_cancel(self._pending)
+        self._pending = self.frame.after(40, self._apply_selection)
+
+    def _apply_selection(self):
+        """Mostra nei campi di dettaglio il componente selezionato."""
+        self._pending = None
+        self._build_right()
+        selezione = self.tree.selection()
+        if not selezione:
+            return
+
+        nome_componente = selezione[0]
+        # Riga già caricata (es. tornata visibile dopo lo scorrimento): non sovrascrivere i campi
+        if nome_componente == self.componente_selezionato:
+            return
+
+        comp = self._componenti_by_name.get(nome_componente)
+        if not comp:
+            return
+
+        self.componente_selezionato = nome_componente
+
+        # Popola i campi
+        sn_iniziale = comp.get('sn_iniziale')
+        inizio_indic = comp.get('inizio_indicizzazione_prefisso')
+        self._imposta_campi({
+            'nome': comp['nome'],
+            'code_12nc': comp.get('code_12nc', ''),
+            'sn_iniziale': str(sn_iniziale) if sn_iniziale is not None else "",
+            'prefisso': comp.get('prefisso_tipo_scheda', '') or "",
+            'inizio_indic': str(inizio_indic) if inizio_indic is not None else ""
+        })
+
+        indicizzazione = comp.get('indicizzazione', True)
+        self._imposta_indic(indicizzazione)
+
+        # Abilita i pulsanti
         self.btn_salva.config(state=tk.NORMAL)
         self.btn_annulla.config(state=tk.NORMAL)
 
+    def _imposta_campi(self, valori: Optional[Dict[str, str]] = None):
+        """Imposta i campi di dettaglio; senza valori li svuota tutti."""
+        for chiave, var in self._vars.items():
+            var.set(valori.get(chiave, "") if valori else "")
+
+    def _toggle_indic(self):
+        """Aggiorna lo stato dell'indicizzazione al click sulla checkbox."""
+        self._indic = not self._indic
+
+    def _imposta_indic(self, valore: bool):
+        """Imposta lo stato dell'indicizzazione e della relativa checkbox."""
+        self._indic = bool(valore)
+        self.chk_indicizzazione.state(['!alternate', 'selected' if self._indic else '!selected'])
+
     def _nuovo_componente(self):
         """Prepara i campi per l'inserimento di un nuovo componente."""
+        self._build_right()
         self.componente_selezionato = None
-        self.tree.selection_remove(*self.tree.selection())
+        self.tree.tk.call(self.tree._w, 'selection', 'set', '')
 
         # Pulisci tutti i campi
-        self.entry_nome.delete(0, tk.END)
-        self.entry_code_12nc.delete(0, tk.END)
-        self.entry_sn_iniziale.delete(0, tk.END)
-        self.entry_prefisso.delete(0, tk.END)
-        self.entry_inizio_indic.delete(0, tk.END)
-        self.var_indicizzazione.set(True)
+        self._imposta_campi()
+        self._imposta_indic(True)
 
         # Abilita i pulsanti
         self.btn_salva.config(state=tk.NORMAL)
@@ -1499,14 +2309,9 @@ class GestioneComponentiTab:
             messagebox.showwarning("Attenzione", "Inserisci il CODE 12NC")
             return
 
+        # Il campo accetta solo cifre (validatecommand)
         sn_iniziale_text = self.entry_sn_iniziale.get().strip()
-        sn_iniziale = None
-        if sn_iniziale_text:
-            try:
-                sn_iniziale = int(sn_iniziale_text)
-            except ValueError:
-                messagebox.showerror("Errore", "SN Iniziale deve essere un numero intero")
-                return
+        sn_iniziale = int(sn_iniziale_text) if sn_iniziale_text else None
 
         prefisso = self.entry_prefisso.get().strip()
         prefisso = prefisso if prefisso else None
@@ -1520,10 +2325,26 @@ class GestioneComponentiTab:
                 messagebox.showerror("Errore", "Inizio Indicizzazione deve essere un numero intero")
                 return
 
-        indicizzazione = self.var_indicizzazione.get()
+        indicizzazione = self._indic
+
+        # Stessa struttura salvata dal gestore: serve ad aggiornare la cache locale
+        comp = {
+            'nome': nome,
+            'code_12nc': code_12nc,
+            'sn_iniziale': sn_iniziale,
+            'prefisso_tipo_scheda': prefisso,
+            'indicizzazione': indicizzazione,
+            'inizio_indicizzazione_prefisso': inizio_indic
+        }
 
-        if self.componente_selezionato:
+        nome_originale = self.componente_selezionato
+        if nome_originale:
             # Modifica esistente
+            if nome != nome_originale and nome in self._componenti_by_name:
+                messagebox.showerror("Errore", f"Esiste già un componente con nome '{nome}'")
+                return
+
+            comp_originale = self._componenti_by_name.get(nome_originale, {})
             try:
                 self.gestore_componenti.modifica_componente(
                     nome_originale=self.componente_selezionato,
@@ -1538,10 +2359,20 @@ class GestioneComponentiTab:
             except ValueError as e:
                 messagebox.showerror("Errore", str(e))
                 return
+
+            self._modifica_riga(nome_originale, comp)
+
+            # La selezione nella prima pagina mostra nome, CODE 12NC e prefisso tipo scheda:
+            # va ridisegnata solo se cambia uno di questi
+            if (nome_originale in self.app_context.componenti_selezionati and
+                    (nome != nome_originale or
+                     code_12nc != comp_originale.get('code_12nc') or
+                     (prefisso or '') != (comp_originale.get('prefisso_tipo_scheda') or ''))):
+                self.app_context._aggiorna_lista_componenti()
         else:
             # Nuovo componente
             try:
-                self.gestore_componenti.aggiungi_componente(
+                aggiunto = self.gestore_componenti.aggiungi_componente(
                     nome=nome,
                     code_12nc=code_12nc,
                     sn_iniziale=sn_iniziale,
@@ -1549,25 +2380,26 @@ class GestioneComponentiTab:
                     inizio_indicizzazione_prefisso=inizio_indic,
                     indicizzazione=indicizzazione
                 )
+                if not aggiunto:
+                    messagebox.showerror("Errore", f"Esiste già un componente con nome '{nome}'")
+                    return
                 messagebox.showinfo("Successo", "Componente aggiunto con successo")
             except ValueError as e:
                 messagebox.showerror("Errore", str(e))
                 return
 
-        # Ricarica la lista e aggiorna anche la sezione di selezione nella prima pagina
-        self._carica_componenti()
-        self.app_context._aggiorna_lista_componenti()
+            self._aggiungi_riga(comp)
+
+        self._revisione_cache = self.gestore_componenti.revisione
         self._annulla_modifica()
 
     def _elimina_componente(self):
         """Elimina il componente selezionato."""
-        selezione = self.tree.selection()
-        if not selezione:
+        if not self.componente_selezionato:
             messagebox.showwarning("Attenzione", "Seleziona un componente da eliminare")
             return
 
-        item = self.tree.item(selezione[0])
-        nome_componente = item['values'][0]
+        nome_componente = self.componente_selezionato
 
         risposta = messagebox.askyesno(
             "Conferma Eliminazione",
@@ -1578,23 +2410,24 @@ class GestioneComponentiTab:
             try:
                 self.gestore_componenti.elimina_componente(nome_componente)
                 messagebox.showinfo("Successo", "Componente eliminato con successo")
-                self._carica_componenti()
-                self.app_context._aggiorna_lista_componenti()
                 self._annulla_modifica()
+                self._rimuovi_riga(nome_componente)
+                self._revisione_cache = self.gestore_componenti.revisione
+                if nome_componente in self.app_context.componenti_selezionati:
+                    self.app_context._aggiorna_lista_componenti()
             except ValueError as e:
                 messagebox.showerror("Errore", str(e))
 
     def _annulla_modifica(self):
         """Annulla la modifica in corso e pulisce i campi."""
         self.componente_selezionato = None
-        self.tree.selection_remove(*self.tree.selection())
+        self.tree.tk.call(self.tree._w, 'selection', 'set', '')
 
-        self.entry_nome.delete(0, tk.END)
-        self.entry_code_12nc.delete(0, tk.END)
-        self.entry_sn_iniziale.delete(0, tk.END)
-        self.entry_prefisso.delete(0, tk.END)
-        self.entry_inizio_indic.delete(0, tk.END)
-        self.var_indicizzazione.set(True)
+        if not self._right_built:
+            return
+
+        self._imposta_campi()
+        self._imposta_indic(True)
 
         self.btn_salva.config(state=tk.DISABLED)
         self.btn_annulla.config(state=tk.DISABLED)
@@ -1604,18 +2437,19 @@ class GestioneComponentiTab:
 # TAB CSV REGISTRAZIONE
 # ============================================================================
 
-class CSVRegTab:
+class CSVRegTab(_SchedaDescrizioniMixin):
     """Gestisce la scheda CSV Reg"""
 
     def __init__(self, parent_notebook, app_context):
         self.notebook = parent_notebook
         self.app_context = app_context
-        self.description_checkboxes = {}
+        self._init_scheda()
 
         self.frame = ttk.Frame(parent_notebook)
         parent_notebook.add(self.frame, text="CSV di Registrazione")
 
-        self.create_widgets()
+        # I widget vengono creati solo quando servono (scheda mostrata o file caricato)
+        self._costruisci_alla_prima_visualizzazione()
 
     def create_widgets(self):
         """Crea il contenuto della scheda CSV Reg"""
@@ -1631,11 +2465,7 @@ class CSVRegTab:
         main_frame = ttk.Frame(canvas, padding=20)
 
         def update_scrollregion(event=None):
-            # Aggiorna la scrollregion basandosi sul contenuto effettivo
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Reset alla posizione iniziale se necessario
-            if canvas.yview()[0] < 0:
-                canvas.yview_moveto(0)
+            self._pianifica_scrollregion(canvas)
 
         main_frame.bind("<Configure>", update_scrollregion)
 
@@ -1718,28 +2548,22 @@ class CSVRegTab:
 
         desc_section.grid_rowconfigure(1, weight=1)
 
-        checkbox_canvas = tk.Canvas(checkbox_container, height=200, highlightthickness=0)
-        checkbox_scrollbar = ttk.Scrollbar(checkbox_container, orient="vertical", command=checkbox_canvas.yview)
-        self.checkbox_frame = ttk.Frame(checkbox_canvas)
-
-        self.checkbox_frame.bind(
-            "<Configure>",
-            lambda _: checkbox_canvas.configure(scrollregion=checkbox_canvas.bbox("all"))
+        # Un'unica Treeview al posto di una Checkbutton per descrizione:
+        # le descrizioni selezionate sono gli elementi selezionati
+        self.desc_tree = ttk.Treeview(
+            checkbox_container,
+            show="tree",
+            selectmode="extended",
+            height=10
         )
+        desc_scrollbar = ttk.Scrollbar(checkbox_container, orient="vertical", command=self.desc_tree.yview)
+        self.desc_tree.configure(yscrollcommand=desc_scrollbar.set)
 
-        checkbox_canvas_window = checkbox_canvas.create_window((0, 0), window=self.checkbox_frame, anchor="nw")
-        checkbox_canvas.configure(yscrollcommand=checkbox_scrollbar.set)
-
-        def on_checkbox_canvas_configure(event):
-            checkbox_canvas.itemconfig(checkbox_canvas_window, width=event.width)
-
-        checkbox_canvas.bind("<Configure>", on_checkbox_canvas_configure)
+        # Il click alterna la selezione della riga, come una checkbox
+        self.desc_tree.bind("<Button-1>", alterna_selezione_riga)
 
-        # Aggiungi supporto rotella del mouse
-        bind_mousewheel_to_canvas(checkbox_canvas)
-
-        checkbox_canvas.pack(side="left", fill="both", expand=True)
-        checkbox_scrollbar.pack(side="right", fill="y")
+        self.desc_tree.pack(side="left", fill="both", expand=True)
+        desc_scrollbar.pack(side="right", fill="y")
 
         buttons_frame = ttk.Frame(desc_section)
         buttons_frame.grid(row=2, column=0, columnspan=3, pady=10)
@@ -1810,30 +2634,48 @@ class CSVRegTab:
     # I campi dati comuni per CSV Reg sono stati spostati nella scheda principale
     # sotto la sezione 'Dati Generali' per centralizzare l'inserimento.
 
+    def _set_input(self, path, label_color="green", label_suffix=""):
+        """Imposta il file di input e aggiorna l'etichetta.
+
+        Args:
+            path (Path): Percorso del file di input
+            label_color (str): Colore del testo dell'etichetta
+            label_suffix (str): Testo aggiunto dopo il nome del file
+        """
+        self.app_context.csv_reg_input_file = path
+        self.input_label.config(text=path.name + label_suffix, foreground=label_color)
+
+    def _set_output(self, path):
+        """Imposta il file di output e aggiorna l'etichetta e il bottone.
+
+        Args:
+            path (Path): Percorso del file di output
+        """
+        self.app_context.CSV_Registrazione_file = path
+        self.output_label.config(text=path.name, foreground="green")
+        self.update_button_state()
+
     def select_input_file(self):
         """Seleziona il file Excel di input"""
         filename = filedialog.askopenfilename(
+            parent=self.app_context.root,
             title="Seleziona file Excel di input",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=EXCEL_FILETYPES
         )
 
         if filename:
-            self.app_context.csv_reg_input_file = Path(filename)
-            self.input_label.config(
-                text=f"{self.app_context.csv_reg_input_file.name}",
-                foreground="green"
-            )
+            path = Path(filename)
+            self._set_input(path)
+            self.status_label.config(text="Caricamento descrizioni...", foreground="blue")
 
-            try:
-                descriptions = DataProcessor.extract_unique_descriptions(
-                    self.app_context.csv_reg_input_file
-                )
+            def on_done(descriptions):
                 self.load_descriptions(descriptions)
                 self.status_label.config(
                     text=f"Trovate {len(descriptions)} descrizioni",
                     foreground="green"
                 )
-            except Exception as e:
+
+            def on_err(e):
                 messagebox.showerror(
                     "Errore",
                     f"Errore nel caricamento delle descrizioni:\n{str(e)}"
@@ -1843,219 +2685,167 @@ class CSVRegTab:
                     foreground="red"
                 )
 
-            self.update_button_state()
+            self._carica_file_async(path, on_done, on_err)
 
     def select_output_file(self):
         """Seleziona il percorso di output per CSV Reg"""
-        if hasattr(self.app_context, 'csv_reg_input_file') and self.app_context.csv_reg_input_file:
-            initialdir = Path(self.app_context.csv_reg_input_file).parent
+        # Entrambi i percorsi sono già oggetti Path (impostati da _set_input/_set_output)
+        input_file = self.app_context.csv_reg_input_file
+        output_file = self.app_context.CSV_Registrazione_file
+        if input_file is not None:
+            initialdir = input_file.parent
             initialfile = "CSV_Registrazione.xlsx"
-        elif hasattr(self.app_context, 'CSV_Registrazione_file') and self.app_context.CSV_Registrazione_file:
-            initialdir = Path(self.app_context.CSV_Registrazione_file).parent
-            initialfile = Path(self.app_context.CSV_Registrazione_file).name
+        elif output_file is not None:
+            initialdir = output_file.parent
+            initialfile = output_file.name
         else:
             initialdir = Path.home()
             initialfile = "CSV_Registrazione.xlsx"
 
         filename = filedialog.asksaveasfilename(
+            parent=self.app_context.root,
             title="Scegli percorso e nome file CSV Reg",
             initialdir=initialdir,
             initialfile=initialfile,
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=EXCEL_FILETYPES
         )
 
         if filename:
-            self.app_context.CSV_Registrazione_file = Path(filename)
-            self.output_label.config(
-                text=f"{self.app_context.CSV_Registrazione_file.name}",
-                foreground="green"
-            )
-            self.update_button_state()
+            self._set_output(Path(filename))
 
-    def select_all_descriptions(self):
-        """Seleziona tutte le descrizioni"""
-        for var in self.description_checkboxes.values():
-            var.set(True)
+    def _input_output_impostati(self):
+        """Indica se input e output sono impostati (abilita il bottone GENERA)"""
+        # Gli attributi sono inizializzati a None dall'interfaccia principale
+        has_input = self.app_context.csv_reg_input_file is not None
+        has_output = self.app_context.CSV_Registrazione_file is not None
+        return has_input and has_output
 
-    def deselect_all_descriptions(self):
-        """Deseleziona tutte le descrizioni"""
-        for var in self.description_checkboxes.values():
-            var.set(False)
-
-    def load_descriptions(self, descriptions):
-        """Carica le descrizioni disponibili e crea le checkbox"""
-        for widget in self.checkbox_frame.winfo_children():
-            widget.destroy()
-        self.description_checkboxes.clear()
-
-        for idx, desc in enumerate(descriptions):
-            var = tk.BooleanVar(value=False)
-            cb = ttk.Checkbutton(self.checkbox_frame, text=desc, variable=var)
-            cb.grid(row=idx, column=0, sticky=tk.W, padx=5, pady=2)
-            self.description_checkboxes[desc] = var
-
-    def update_button_state(self):
-        """Abilita il bottone GENERA CSV REG solo se input e output sono impostati"""
-        has_input = (
-            hasattr(self.app_context, 'csv_reg_input_file') and
-            self.app_context.csv_reg_input_file is not None
-        )
-        has_output = (
-            hasattr(self.app_context, 'CSV_Registrazione_file') and
-            self.app_context.CSV_Registrazione_file is not None
-        )
-
-        if has_input and has_output:
-            self.generate_button.state(['!disabled'])
-        else:
-            self.generate_button.state(['disabled'])
+    def load_shared_input_file(self, file_path, descriptions=None, errore=None):
+        """Carica il file di input condiviso.
 
-    def load_shared_input_file(self, file_path):
-        """Carica il file di input condiviso."""
-        self.app_context.csv_reg_input_file = Path(file_path)
-        self.input_label.config(
-            text=f"{self.app_context.csv_reg_input_file.name} (File Condiviso)",
-            foreground="blue"
-        )
+        Args:
+            file_path: Percorso del file condiviso
+            descriptions: Descrizioni già lette dal file, se None vengono lette ora
+            errore: Errore della lettura già eseguita
+        """
+        self._build()
+        path = Path(file_path)
+        self._set_input(path, "blue", " (File Condiviso)")
 
-        try:
-            descriptions = DataProcessor.extract_unique_descriptions(
-                self.app_context.csv_reg_input_file
-            )
+        def on_done(descriptions):
             self.load_descriptions(descriptions)
             self.status_label.config(
                 text=f"File condiviso caricato - {len(descriptions)} descrizioni",
                 foreground="blue"
             )
-        except Exception as e:
+
+        def on_err(e):
             self.status_label.config(
                 text="Errore nel caricamento del file condiviso",
                 foreground="red"
             )
 
-        self.update_button_state()
-
-    def load_from_main_tab(self, generated_file_path, silent=False):
-        """Carica automaticamente il file generato dalla scheda principale."""
-        self.app_context.csv_reg_input_file = Path(generated_file_path)
-        self.input_label.config(
-            text=f"{self.app_context.csv_reg_input_file.name}",
-            foreground="blue" if not silent else "green"
-        )
-
-        try:
-            descriptions = DataProcessor.extract_unique_descriptions(
-                self.app_context.csv_reg_input_file
-            )
-            self.load_descriptions(descriptions)
-            if not silent:
-                self.status_label.config(
-                    text=f"File caricato automaticamente - {len(descriptions)} descrizioni",
-                    foreground="blue"
-                )
-            else:
-                self.status_label.config(
-                    text=f"File pronto - {len(descriptions)} descrizioni",
-                    foreground="green"
-                )
-        except Exception as e:
-            if not silent:
-                messagebox.showerror(
-                    "Errore",
-                    f"Errore nel caricamento delle descrizioni:\n{str(e)}"
-                )
-
-        self.update_button_state()
+        self._carica_file(path, descriptions, errore, on_done, on_err)
 
     def generate_csvreg(self):
         """Genera il file CSV_Reg filtrando per le descrizioni selezionate"""
         try:
-            selected_descriptions = [
-                desc for desc, var in self.description_checkboxes.items() if var.get()
-            ]
+            selected_descriptions = list(self.desc_tree.selection())
 
             if not selected_descriptions:
                 messagebox.showwarning("Attenzione", "Seleziona almeno una descrizione!")
                 return
 
-            extra_fields = {}
-            # Preleva i campi comuni dalla scheda principale (Generazione Documento)
-            if hasattr(self.app_context, 'dati_generali_extra_entries'):
-                for field_name, entry in self.app_context.dati_generali_extra_entries.items():
-                    value = entry.get().strip()
-                    extra_fields[field_name] = value
-            else:
-                # Fallback: se per qualche motivo la vecchia struttura è ancora presente
-                if hasattr(self, 'extra_fields_entries'):
-                    for field_name, entry in self.extra_fields_entries.items():
-                        value = entry.get().strip()
-                        extra_fields[field_name] = value
+            # Preleva i campi comuni dalla scheda principale (Generazione Documento),
+            # che li crea prima delle altre schede
+            extra_fields = {
+                field_name: entry.get().strip()
+                for field_name, entry in self.app_context.dati_generali_extra_entries.items()
+            }
 
             # Aggiungi esplicitamente le Bolla (i nomi sono quelli attesi da DataProcessor)
-            try:
-                bolla_prod = self.app_context.entry_bolla_produzione.get().strip()
-            except Exception:
-                bolla_prod = ""
-            try:
-                bolla_vend = self.app_context.entry_bolla_vendita.get().strip()
-            except Exception:
-                bolla_vend = ""
+            extra_fields["Bolla Produzione"] = self.app_context.entry_bolla_produzione.get().strip()
+            extra_fields["Bolla Vendita Techrail"] = self.app_context.entry_bolla_vendita.get().strip()
+        except Exception as e:
+            messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
 
-            extra_fields["Bolla Produzione"] = bolla_prod
-            extra_fields["Bolla Vendita Techrail"] = bolla_vend
+        self.status_label.config(text="Generazione CSV Reg in corso...", foreground="blue")
+        self.progress.configure(mode='determinate', maximum=100, value=0)
+        self.generate_button.state(['disabled'])
 
-            self.status_label.config(text="Generazione CSV Reg in corso...", foreground="blue")
-            self.progress.start()
-            self.frame.update()
+        # Scritto dal thread di generazione, letto dal thread Tk
+        percentuale = [0]
 
-            rows_count = DataProcessor.generate_csv_reg(
-                self.app_context.csv_reg_input_file,
-                self.app_context.CSV_Registrazione_file,
-                selected_descriptions,
-                extra_fields
-            )
+        def progress_cb(done, total):
+            percentuale[0] = done * 100 // total if total else 100
 
-            self.progress.stop()
-            self.status_label.config(
-                text=f"CSV Reg generato! Righe: {rows_count}",
-                foreground="green"
-            )
+        future = self.app_context._executor.submit(
+            DataProcessor.generate_csv_reg,
+            self.app_context.csv_reg_input_file,
+            self.app_context.CSV_Registrazione_file,
+            selected_descriptions,
+            extra_fields,
+            progress_cb
+        )
 
-            messagebox.showinfo(
-                "Successo",
-                f"File CSV Reg generato con successo!\n\n"
-                f"File output:\n{self.app_context.CSV_Registrazione_file}\n\n"
-                f"Righe generate: {rows_count}\n"
-                f"Descrizioni incluse: {len(selected_descriptions)}"
-            )
+        def aggiorna_percentuale():
+            self.progress['value'] = percentuale[0]
+
+        self._segui_generazione(
+            future,
+            lambda future: self._on_csvreg_generato(future, len(selected_descriptions)),
+            intervallo=50,
+            on_attesa=aggiorna_percentuale
+        )
 
+    def _on_csvreg_generato(self, future, n_descrizioni):
+        """Mostra l'esito della generazione del CSV Reg (thread Tk)."""
+        try:
+            rows_count = future.result()
         except ValueError as ve:
-            self.progress.stop()
+            self.progress['value'] = 0
             self.status_label.config(text="Nessuna riga da generare", foreground="red")
             messagebox.showwarning("Attenzione", str(ve))
+            return
         except Exception as e:
-            self.progress.stop()
+            self.progress['value'] = 0
             self.status_label.config(text="Errore durante la generazione", foreground="red")
             messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
+
+        self.status_label.config(
+            text=f"CSV Reg generato! Righe: {rows_count}",
+            foreground="green"
+        )
+
+        messagebox.showinfo(
+            "Successo",
+            f"File CSV Reg generato con successo!\n\n"
+            f"File output:\n{self.app_context.CSV_Registrazione_file}\n\n"
+            f"Righe generate: {rows_count}\n"
+            f"Descrizioni incluse: {n_descrizioni}"
+        )
 
 
 # ============================================================================
 # TAB IMPORT GESTIONALE
 # ============================================================================
 
-class ImportGestionaleTab:
+class ImportGestionaleTab(_SchedaDescrizioniMixin):
     """Gestisce la scheda Import Gestionale"""
 
     def __init__(self, parent_notebook, app_context):
         self.notebook = parent_notebook
         self.app_context = app_context
-        self.description_checkboxes = {}
+        self._init_scheda()
 
         self.frame = ttk.Frame(parent_notebook)
         parent_notebook.add(self.frame, text="Import Gestionale")
 
-        self.create_widgets()
+        # I widget vengono creati solo quando servono (scheda mostrata o file caricato)
+        self._costruisci_alla_prima_visualizzazione()
 
     def create_widgets(self):
         """Crea il contenuto della scheda Import Gestionale"""
@@ -2071,11 +2861,7 @@ class ImportGestionaleTab:
         main_frame = ttk.Frame(canvas, padding=20)
 
         def update_scrollregion(event=None):
-            # Aggiorna la scrollregion basandosi sul contenuto effettivo
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Reset alla posizione iniziale se necessario
-            if canvas.yview()[0] < 0:
-                canvas.yview_moveto(0)
+            self._pianifica_scrollregion(canvas)
 
         main_frame.bind("<Configure>", update_scrollregion)
 
@@ -2158,28 +2944,22 @@ class ImportGestionaleTab:
 
         desc_section.grid_rowconfigure(1, weight=1)
 
-        checkbox_canvas = tk.Canvas(checkbox_container, height=200, highlightthickness=0)
-        checkbox_scrollbar = ttk.Scrollbar(checkbox_container, orient="vertical", command=checkbox_canvas.yview)
-        self.checkbox_frame = ttk.Frame(checkbox_canvas)
-
-        self.checkbox_frame.bind(
-            "<Configure>",
-            lambda _: checkbox_canvas.configure(scrollregion=checkbox_canvas.bbox("all"))
+        # Un'unica Treeview al posto di una Checkbutton per descrizione:
+        # le descrizioni selezionate sono gli elementi selezionati
+        self.desc_tree = ttk.Treeview(
+            checkbox_container,
+            show="tree",
+            selectmode="extended",
+            height=10
         )
+        desc_scrollbar = ttk.Scrollbar(checkbox_container, orient="vertical", command=self.desc_tree.yview)
+        self.desc_tree.configure(yscrollcommand=desc_scrollbar.set)
 
-        checkbox_canvas_window = checkbox_canvas.create_window((0, 0), window=self.checkbox_frame, anchor="nw")
-        checkbox_canvas.configure(yscrollcommand=checkbox_scrollbar.set)
-
-        def on_checkbox_canvas_configure(event):
-            checkbox_canvas.itemconfig(checkbox_canvas_window, width=event.width)
+        # Il click alterna la selezione della riga, come una checkbox
+        self.desc_tree.bind("<Button-1>", alterna_selezione_riga)
 
-        checkbox_canvas.bind("<Configure>", on_checkbox_canvas_configure)
-
-        # Aggiungi supporto rotella del mouse
-        bind_mousewheel_to_canvas(checkbox_canvas)
-
-        checkbox_canvas.pack(side="left", fill="both", expand=True)
-        checkbox_scrollbar.pack(side="right", fill="y")
+        self.desc_tree.pack(side="left", fill="both", expand=True)
+        desc_scrollbar.pack(side="right", fill="y")
 
         buttons_frame = ttk.Frame(desc_section)
         buttons_frame.grid(row=2, column=0, columnspan=3, pady=10)
@@ -2250,8 +3030,9 @@ class ImportGestionaleTab:
     def select_input_file(self):
         """Seleziona il file Excel di input"""
         filename = filedialog.askopenfilename(
+            parent=self.app_context.root,
             title="Seleziona file Excel di input",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=EXCEL_FILETYPES
         )
 
         if filename:
@@ -2260,17 +3041,16 @@ class ImportGestionaleTab:
                 text=f"{self.app_context.import_gestionale_input_file.name}",
                 foreground="green"
             )
+            self.status_label.config(text="Caricamento descrizioni...", foreground="blue")
 
-            try:
-                descriptions = DataProcessor.extract_unique_descriptions(
-                    self.app_context.import_gestionale_input_file
-                )
+            def on_done(descriptions):
                 self.load_descriptions(descriptions)
                 self.status_label.config(
                     text=f"Trovate {len(descriptions)} descrizioni",
                     foreground="green"
                 )
-            except Exception as e:
+
+            def on_err(e):
                 messagebox.showerror(
                     "Errore",
                     f"Errore nel caricamento delle descrizioni:\n{str(e)}"
@@ -2280,14 +3060,14 @@ class ImportGestionaleTab:
                     foreground="red"
                 )
 
-            self.update_button_state()
+            self._carica_file_async(self.app_context.import_gestionale_input_file, on_done, on_err)
 
     def select_output_file(self):
         """Seleziona il percorso di output"""
-        if hasattr(self.app_context, 'import_gestionale_input_file') and self.app_context.import_gestionale_input_file:
+        if self.app_context.import_gestionale_input_file is not None:
             initialdir = Path(self.app_context.import_gestionale_input_file).parent
             initialfile = "Import_Gestionale.xlsx"
-        elif hasattr(self.app_context, 'Import_Gestionale_file') and self.app_context.Import_Gestionale_file:
+        elif self.app_context.Import_Gestionale_file is not None:
             initialdir = Path(self.app_context.Import_Gestionale_file).parent
             initialfile = Path(self.app_context.Import_Gestionale_file).name
         else:
@@ -2295,11 +3075,12 @@ class ImportGestionaleTab:
             initialfile = "Import_Gestionale.xlsx"
 
         filename = filedialog.asksaveasfilename(
+            parent=self.app_context.root,
             title="Scegli percorso e nome file",
             initialdir=initialdir,
             initialfile=initialfile,
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=EXCEL_FILETYPES
         )
 
         if filename:
@@ -2310,107 +3091,47 @@ class ImportGestionaleTab:
             )
             self.update_button_state()
 
-    def select_all_descriptions(self):
-        """Seleziona tutte le descrizioni"""
-        for var in self.description_checkboxes.values():
-            var.set(True)
-
-    def deselect_all_descriptions(self):
-        """Deseleziona tutte le descrizioni"""
-        for var in self.description_checkboxes.values():
-            var.set(False)
-
-    def load_descriptions(self, descriptions):
-        """Carica le descrizioni disponibili e crea le checkbox"""
-        for widget in self.checkbox_frame.winfo_children():
-            widget.destroy()
-        self.description_checkboxes.clear()
-
-        for idx, desc in enumerate(descriptions):
-            var = tk.BooleanVar(value=False)
-            cb = ttk.Checkbutton(self.checkbox_frame, text=desc, variable=var)
-            cb.grid(row=idx, column=0, sticky=tk.W, padx=5, pady=2)
-            self.description_checkboxes[desc] = var
+    def _input_output_impostati(self):
+        """Indica se input e output sono impostati (abilita il bottone GENERA)"""
+        # Gli attributi sono inizializzati a None dall'interfaccia principale
+        has_input = self.app_context.import_gestionale_input_file is not None
+        has_output = self.app_context.Import_Gestionale_file is not None
+        return has_input and has_output
 
-    def update_button_state(self):
-        """Abilita il bottone GENERA solo se input e output sono impostati"""
-        has_input = (
-            hasattr(self.app_context, 'import_gestionale_input_file') and
-            self.app_context.import_gestionale_input_file is not None
-        )
-        has_output = (
-            hasattr(self.app_context, 'Import_Gestionale_file') and
-            self.app_context.Import_Gestionale_file is not None
-        )
+    def load_shared_input_file(self, file_path, descriptions=None, errore=None):
+        """Carica il file di input condiviso.
 
-        if has_input and has_output:
-            self.generate_button.state(['!disabled'])
-        else:
-            self.generate_button.state(['disabled'])
-
-    def load_shared_input_file(self, file_path):
-        """Carica il file di input condiviso."""
+        Args:
+            file_path: Percorso del file condiviso
+            descriptions: Descrizioni già lette dal file, se None vengono lette ora
+            errore: Errore della lettura già eseguita
+        """
+        self._build()
         self.app_context.import_gestionale_input_file = Path(file_path)
         self.input_label.config(
             text=f"{self.app_context.import_gestionale_input_file.name} (File Condiviso)",
             foreground="blue"
         )
 
-        try:
-            descriptions = DataProcessor.extract_unique_descriptions(
-                self.app_context.import_gestionale_input_file
-            )
+        def on_done(descriptions):
             self.load_descriptions(descriptions)
             self.status_label.config(
                 text=f"File condiviso caricato - {len(descriptions)} descrizioni",
                 foreground="blue"
             )
-        except Exception as e:
+
+        def on_err(e):
             self.status_label.config(
                 text="Errore nel caricamento del file condiviso",
                 foreground="red"
             )
 
-        self.update_button_state()
-
-    def load_from_main_tab(self, generated_file_path, silent=False):
-        """Carica automaticamente il file generato dalla scheda principale."""
-        self.app_context.import_gestionale_input_file = Path(generated_file_path)
-        self.input_label.config(
-            text=f"{self.app_context.import_gestionale_input_file.name}",
-            foreground="blue" if not silent else "green"
-        )
-
-        try:
-            descriptions = DataProcessor.extract_unique_descriptions(
-                self.app_context.import_gestionale_input_file
-            )
-            self.load_descriptions(descriptions)
-            if not silent:
-                self.status_label.config(
-                    text=f"File caricato automaticamente - {len(descriptions)} descrizioni",
-                    foreground="blue"
-                )
-            else:
-                self.status_label.config(
-                    text=f"File pronto - {len(descriptions)} descrizioni",
-                    foreground="green"
-                )
-        except Exception as e:
-            if not silent:
-                messagebox.showerror(
-                    "Errore",
-                    f"Errore nel caricamento delle descrizioni:\n{str(e)}"
-                )
-
-        self.update_button_state()
+        self._carica_file(self.app_context.import_gestionale_input_file, descriptions, errore, on_done, on_err)
 
     def generate_import_gestionale(self):
         """Genera il file Import Gestionale filtrando per le descrizioni selezionate"""
         try:
-            selected_descriptions = [
-                desc for desc, var in self.description_checkboxes.items() if var.get()
-            ]
+            selected_descriptions = list(self.desc_tree.selection())
 
             if not selected_descriptions:
                 messagebox.showwarning("Attenzione", "Seleziona almeno una descrizione!")
@@ -2441,49 +3162,61 @@ class ImportGestionaleTab:
 
             extra_fields["Bolla Produzione"] = bolla_prod
             extra_fields["Bolla Vendita Techrail"] = bolla_vend
+        except Exception as e:
+            messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
 
-            self.status_label.config(text="Generazione Import Gestionale in corso...", foreground="blue")
-            self.progress.start()
-            self.frame.update()
-
-            rows_count = DataProcessor.generate_import_gestionale(
-                self.app_context.import_gestionale_input_file,
-                self.app_context.Import_Gestionale_file,
-                selected_descriptions,
-                extra_fields
-            )
-
-            self.progress.stop()
-            self.status_label.config(
-                text=f"Import Gestionale generato! Righe: {rows_count}",
-                foreground="green"
-            )
+        self.status_label.config(text="Generazione Import Gestionale in corso...", foreground="blue")
+        self.generate_button.state(['disabled'])
+        self.progress.start()
+
+        future = self.app_context._executor.submit(
+            DataProcessor.generate_import_gestionale,
+            self.app_context.import_gestionale_input_file,
+            self.app_context.Import_Gestionale_file,
+            selected_descriptions,
+            extra_fields
+        )
 
-            messagebox.showinfo(
-                "Successo",
-                f"File Import Gestionale generato con successo!\n\n"
-                f"File output:\n{self.app_context.Import_Gestionale_file}\n\n"
-                f"Righe generate: {rows_count}\n"
-                f"Descrizioni incluse: {len(selected_descriptions)}"
-            )
+        self._segui_generazione(
+            future,
+            lambda future: self._on_import_gestionale_generato(future, len(selected_descriptions))
+        )
 
+    def _on_import_gestionale_generato(self, future, n_descrizioni):
+        """Mostra l'esito della generazione dell'Import Gestionale (thread Tk)."""
+        try:
+            rows_count = future.result()
         except ValueError as ve:
-            self.progress.stop()
             self.status_label.config(text="Nessuna riga da generare", foreground="red")
             messagebox.showwarning("Attenzione", str(ve))
+            return
         except Exception as e:
-            self.progress.stop()
             self.status_label.config(text="Errore durante la generazione", foreground="red")
             messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
+
+        self.status_label.config(
+            text=f"Import Gestionale generato! Righe: {rows_count}",
+            foreground="green"
+        )
+
+        messagebox.showinfo(
+            "Successo",
+            f"File Import Gestionale generato con successo!\n\n"
+            f"File output:\n{self.app_context.Import_Gestionale_file}\n\n"
+            f"Righe generate: {rows_count}\n"
+            f"Descrizioni incluse: {n_descrizioni}"
+        )
 
 
-class EtichetteBoxTab:
+class EtichetteBoxTab(_SchedaDescrizioniMixin):
     """Gestisce la scheda Etichette Bus"""
 
     def __init__(self, parent_notebook, app_context):
         self.notebook = parent_notebook
         self.app_context = app_context
-        self.description_checkboxes = {}
+        self._init_scheda()
 
         self.frame = ttk.Frame(parent_notebook)
         # Nota: la scheda 'Etichette Bus' non viene aggiunta automaticamente al notebook
@@ -2491,7 +3224,8 @@ class EtichetteBoxTab:
         # decommentare la riga seguente.
         # parent_notebook.add(self.frame, text="Etichette Bus")
 
-        self.create_widgets()
+        # I widget vengono creati solo quando servono (scheda mostrata o file caricato)
+        self._costruisci_alla_prima_visualizzazione()
 
     def create_widgets(self):
         """Crea il contenuto della scheda Etichette Bus"""
@@ -2506,10 +3240,10 @@ class EtichetteBoxTab:
         scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
         main_frame = ttk.Frame(canvas, padding=20)
 
-        main_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        def update_scrollregion(event=None):
+            self._pianifica_scrollregion(canvas)
+
+        main_frame.bind("<Configure>", update_scrollregion)
 
         canvas_window = canvas.create_window((0, 0), window=main_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -2581,28 +3315,22 @@ class EtichetteBoxTab:
 
         desc_section.grid_rowconfigure(1, weight=1)
 
-        checkbox_canvas = tk.Canvas(checkbox_container, height=200, highlightthickness=0)
-        checkbox_scrollbar = ttk.Scrollbar(checkbox_container, orient="vertical", command=checkbox_canvas.yview)
-        self.checkbox_frame = ttk.Frame(checkbox_canvas)
-
-        self.checkbox_frame.bind(
-            "<Configure>",
-            lambda _: checkbox_canvas.configure(scrollregion=checkbox_canvas.bbox("all"))
+        # Un'unica Treeview al posto di una Checkbutton per descrizione:
+        # le descrizioni selezionate sono gli elementi selezionati
+        self.desc_tree = ttk.Treeview(
+            checkbox_container,
+            show="tree",
+            selectmode="extended",
+            height=10
         )
+        desc_scrollbar = ttk.Scrollbar(checkbox_container, orient="vertical", command=self.desc_tree.yview)
+        self.desc_tree.configure(yscrollcommand=desc_scrollbar.set)
 
-        checkbox_canvas_window = checkbox_canvas.create_window((0, 0), window=self.checkbox_frame, anchor="nw")
-        checkbox_canvas.configure(yscrollcommand=checkbox_scrollbar.set)
-
-        def on_checkbox_canvas_configure(event):
-            checkbox_canvas.itemconfig(checkbox_canvas_window, width=event.width)
+        # Il click alterna la selezione della riga, come una checkbox
+        self.desc_tree.bind("<Button-1>", alterna_selezione_riga)
 
-        checkbox_canvas.bind("<Configure>", on_checkbox_canvas_configure)
-
-        # Aggiungi supporto rotella del mouse
-        bind_mousewheel_to_canvas(checkbox_canvas)
-
-        checkbox_canvas.pack(side="left", fill="both", expand=True)
-        checkbox_scrollbar.pack(side="right", fill="y")
+        self.desc_tree.pack(side="left", fill="both", expand=True)
+        desc_scrollbar.pack(side="right", fill="y")
 
         buttons_frame = ttk.Frame(desc_section)
         buttons_frame.grid(row=2, column=0, columnspan=3, pady=10)
@@ -2673,8 +3401,9 @@ class EtichetteBoxTab:
     def select_input_file(self):
         """Seleziona il file Excel di input"""
         filename = filedialog.askopenfilename(
+            parent=self.app_context.root,
             title="Seleziona file Excel di input",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=EXCEL_FILETYPES
         )
 
         if filename:
@@ -2683,17 +3412,16 @@ class EtichetteBoxTab:
                 text=f"{self.app_context.etichettebox_input_file.name}",
                 foreground="green"
             )
+            self.status_label.config(text="Caricamento descrizioni...", foreground="blue")
 
-            try:
-                descriptions = DataProcessor.extract_unique_descriptions(
-                    self.app_context.etichettebox_input_file
-                )
+            def on_done(descriptions):
                 self.load_descriptions(descriptions)
                 self.status_label.config(
                     text=f"Trovate {len(descriptions)} descrizioni",
                     foreground="green"
                 )
-            except Exception as e:
+
+            def on_err(e):
                 messagebox.showerror(
                     "Errore",
                     f"Errore nel caricamento delle descrizioni:\n{str(e)}"
@@ -2703,14 +3431,14 @@ class EtichetteBoxTab:
                     foreground="red"
                 )
 
-            self.update_button_state()
+            self._carica_file_async(self.app_context.etichettebox_input_file, on_done, on_err)
 
     def select_output_file(self):
         """Seleziona il percorso di output per Etichette Bus"""
-        if hasattr(self.app_context, 'etichettebox_input_file') and self.app_context.etichettebox_input_file:
+        if self.app_context.etichettebox_input_file is not None:
             initialdir = Path(self.app_context.etichettebox_input_file).parent
             initialfile = "EtichetteBOX_Output.xlsx"
-        elif hasattr(self.app_context, 'etichettebox_output_file') and self.app_context.etichettebox_output_file:
+        elif self.app_context.etichettebox_output_file is not None:
             initialdir = Path(self.app_context.etichettebox_output_file).parent
             initialfile = Path(self.app_context.etichettebox_output_file).name
         else:
@@ -2718,11 +3446,12 @@ class EtichetteBoxTab:
             initialfile = "EtichetteBOX_Output.xlsx"
 
         filename = filedialog.asksaveasfilename(
+            parent=self.app_context.root,
             title="Scegli percorso e nome file Etichette Bus",
             initialdir=initialdir,
             initialfile=initialfile,
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=EXCEL_FILETYPES
         )
 
         if filename:
@@ -2733,157 +3462,106 @@ class EtichetteBoxTab:
             )
             self.update_button_state()
 
-    def select_all_descriptions(self):
-        """Seleziona tutte le descrizioni"""
-        for var in self.description_checkboxes.values():
-            var.set(True)
-
-    def deselect_all_descriptions(self):
-        """Deseleziona tutte le descrizioni"""
-        for var in self.description_checkboxes.values():
-            var.set(False)
-
-    def load_descriptions(self, descriptions):
-        """Carica le descrizioni disponibili e crea le checkbox"""
-        for widget in self.checkbox_frame.winfo_children():
-            widget.destroy()
-        self.description_checkboxes.clear()
+    def _input_output_impostati(self):
+        """Indica se input e output sono impostati (abilita il bottone GENERA)"""
+        # Gli attributi sono inizializzati a None dall'interfaccia principale
+        has_input = self.app_context.etichettebox_input_file is not None
+        has_output = self.app_context.etichettebox_output_file is not None
+        return has_input and has_output
 
-        for idx, desc in enumerate(descriptions):
-            var = tk.BooleanVar(value=False)
-            cb = ttk.Checkbutton(self.checkbox_frame, text=desc, variable=var)
-            cb.grid(row=idx, column=0, sticky=tk.W, padx=5, pady=2)
-            self.description_checkboxes[desc] = var
-
-    def update_button_state(self):
-        """Abilita il bottone GENERA solo se input e output sono impostati"""
-        has_input = (
-            hasattr(self.app_context, 'etichettebox_input_file') and
-            self.app_context.etichettebox_input_file is not None
-        )
-        has_output = (
-            hasattr(self.app_context, 'etichettebox_output_file') and
-            self.app_context.etichettebox_output_file is not None
-        )
-
-        if has_input and has_output:
-            self.generate_button.state(['!disabled'])
-        else:
-            self.generate_button.state(['disabled'])
+    def load_shared_input_file(self, file_path, descriptions=None, errore=None):
+        """Carica il file di input condiviso.
 
-    def load_shared_input_file(self, file_path):
-        """Carica il file di input condiviso."""
+        Args:
+            file_path: Percorso del file condiviso
+            descriptions: Descrizioni già lette dal file, se None vengono lette ora
+            errore: Errore della lettura già eseguita
+        """
+        self._build()
         self.app_context.etichettebox_input_file = Path(file_path)
         self.input_label.config(
             text=f"{self.app_context.etichettebox_input_file.name} (File Condiviso)",
             foreground="blue"
         )
 
-        try:
-            descriptions = DataProcessor.extract_unique_descriptions(
-                self.app_context.etichettebox_input_file
-            )
+        def on_done(descriptions):
             self.load_descriptions(descriptions)
             self.status_label.config(
                 text=f"File condiviso caricato - {len(descriptions)} descrizioni",
                 foreground="blue"
             )
-        except Exception as e:
+
+        def on_err(e):
             self.status_label.config(
                 text="Errore nel caricamento del file condiviso",
                 foreground="red"
             )
 
-        self.update_button_state()
-
-    def load_from_main_tab(self, generated_file_path, silent=False):
-        """Carica automaticamente il file generato dalla scheda principale."""
-        self.app_context.etichettebox_input_file = Path(generated_file_path)
-        self.input_label.config(
-            text=f"{self.app_context.etichettebox_input_file.name}",
-            foreground="blue" if not silent else "green"
-        )
-
-        try:
-            descriptions = DataProcessor.extract_unique_descriptions(
-                self.app_context.etichettebox_input_file
-            )
-            self.load_descriptions(descriptions)
-            if not silent:
-                self.status_label.config(
-                    text=f"File caricato automaticamente - {len(descriptions)} descrizioni",
-                    foreground="blue"
-                )
-            else:
-                self.status_label.config(
-                    text=f"File pronto - {len(descriptions)} descrizioni",
-                    foreground="green"
-                )
-        except Exception as e:
-            if not silent:
-                messagebox.showerror(
-                    "Errore",
-                    f"Errore nel caricamento delle descrizioni:\n{str(e)}"
-                )
-
-        self.update_button_state()
+        self._carica_file(self.app_context.etichettebox_input_file, descriptions, errore, on_done, on_err)
 
     def generate_etichettebox(self):
         """Genera il file EtichetteBOX.xlsx"""
-        try:
-            selected_descriptions = [
-                desc for desc, var in self.description_checkboxes.items() if var.get()
-            ]
-
-            if not selected_descriptions:
-                messagebox.showwarning("Attenzione", "Seleziona almeno una descrizione!")
-                return
+        selected_descriptions = list(self.desc_tree.selection())
 
-            self.status_label.config(text="Generazione Etichette Bus in corso...", foreground="blue")
-            self.progress.start()
-            self.frame.update()
+        if not selected_descriptions:
+            messagebox.showwarning("Attenzione", "Seleziona almeno una descrizione!")
+            return
 
-            rows_count = DataProcessor.generate_etichettebox_excel(
-                self.app_context.etichettebox_input_file,
-                self.app_context.etichettebox_output_file,
-                selected_descriptions
-            )
+        self.status_label.config(text="Generazione Etichette Bus in corso...", foreground="blue")
+        # Il bottone resta disabilitato finché la generazione non è terminata
+        self.generate_button.state(['disabled'])
+        self.progress.start()
 
-            self.progress.stop()
-            self.status_label.config(
-                text=f"Etichette Bus generate! Righe: {rows_count}",
-                foreground="green"
-            )
+        future = self.app_context._executor.submit(
+            DataProcessor.generate_etichettebox_excel,
+            self.app_context.etichettebox_input_file,
+            self.app_context.etichettebox_output_file,
+            selected_descriptions
+        )
 
-            messagebox.showinfo(
-                "Successo",
-                f"File Etichette Bus generato con successo!\n\n"
-                f"File output:\n{self.app_context.etichettebox_output_file}\n\n"
-                f"Righe generate: {rows_count}\n"
-                f"Descrizioni incluse: {len(selected_descriptions)}"
-            )
+        self._segui_generazione(
+            future,
+            lambda future: self._on_etichettebox_generato(future, len(selected_descriptions))
+        )
 
+    def _on_etichettebox_generato(self, future, n_descrizioni):
+        """Mostra l'esito della generazione delle Etichette Bus (thread Tk)."""
+        try:
+            rows_count = future.result()
         except ValueError as ve:
-            self.progress.stop()
             self.status_label.config(text="Nessun bus da generare", foreground="red")
             messagebox.showwarning("Attenzione", str(ve))
+            return
         except Exception as e:
-            self.progress.stop()
             self.status_label.config(text="Errore durante la generazione", foreground="red")
             messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
+
+        self.status_label.config(
+            text=f"Etichette Bus generate! Righe: {rows_count}",
+            foreground="green"
+        )
+
+        messagebox.showinfo(
+            "Successo",
+            f"File Etichette Bus generato con successo!\n\n"
+            f"File output:\n{self.app_context.etichettebox_output_file}\n\n"
+            f"Righe generate: {rows_count}\n"
+            f"Descrizioni incluse: {n_descrizioni}"
+        )
 
 
 # ============================================================================
 # TAB Etichette Naz
 # ============================================================================
 
-class EtichettePDFTab:
+class EtichettePDFTab(_SchedaFileMixin):
     """Gestisce la scheda EtichettePDF"""
 
     def __init__(self, notebook, app_context):
         self.notebook = notebook
         self.app_context = app_context
-        self.tipo_scheda_checkboxes = {}
+        self._init_scheda()
         # mappa checkbox_label -> (descrizione, prefisso_tipo) usata dalla scheda Word
         self._word_label_mapping: Dict[str, tuple] = {}
         self.filter_enabled_var = tk.BooleanVar(value=True)
@@ -2907,11 +3585,7 @@ class EtichettePDFTab:
         self.scrollable_frame = ttk.Frame(canvas)
 
         def update_scrollregion(event=None):
-            # Aggiorna la scrollregion basandosi sul contenuto effettivo
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Reset alla posizione iniziale se necessario
-            if canvas.yview()[0] < 0:
-                canvas.yview_moveto(0)
+            self._pianifica_scrollregion(canvas)
 
         self.scrollable_frame.bind("<Configure>", update_scrollregion)
 
@@ -2954,25 +3628,22 @@ class EtichettePDFTab:
         checkbox_container = ttk.Frame(self.scrollable_frame)
         checkbox_container.grid(row=4, column=0, columnspan=3, sticky="nsew", pady=5, padx=10)
 
-        canvas_cb = tk.Canvas(checkbox_container, height=150, highlightthickness=0)
-        scrollbar_cb = ttk.Scrollbar(checkbox_container, orient="vertical", command=canvas_cb.yview)
-        self.checkbox_frame = ttk.Frame(canvas_cb)
-
-        self.checkbox_frame.bind(
-            "<Configure>",
-            lambda _: canvas_cb.configure(scrollregion=canvas_cb.bbox("all"))
+        # Un'unica Treeview al posto di una Checkbutton per codice:
+        # i CODE 12NC selezionati sono gli elementi selezionati
+        self.code_tree = ttk.Treeview(
+            checkbox_container,
+            show="tree",
+            selectmode="extended",
+            height=7
         )
+        code_scrollbar = ttk.Scrollbar(checkbox_container, orient="vertical", command=self.code_tree.yview)
+        self.code_tree.configure(yscrollcommand=code_scrollbar.set)
 
-        checkbox_canvas_window = canvas_cb.create_window((0, 0), window=self.checkbox_frame, anchor="nw")
-        canvas_cb.configure(yscrollcommand=scrollbar_cb.set)
+        # Il click alterna la selezione della riga, come una checkbox
+        self.code_tree.bind("<Button-1>", alterna_selezione_riga)
 
-        def on_checkbox_canvas_configure(event):
-            canvas_cb.itemconfig(checkbox_canvas_window, width=event.width)
-
-        canvas_cb.bind("<Configure>", on_checkbox_canvas_configure)
-
-        canvas_cb.pack(side="left", fill="both", expand=True)
-        scrollbar_cb.pack(side="right", fill="y")
+        self.code_tree.pack(side="left", fill="both", expand=True)
+        code_scrollbar.pack(side="right", fill="y")
 
         buttons_frame = ttk.Frame(self.scrollable_frame)
         buttons_frame.grid(row=5, column=0, columnspan=3, pady=5)
@@ -3086,13 +3757,9 @@ class EtichettePDFTab:
     def select_input_file(self):
         """Seleziona il file Excel di input"""
         filename = filedialog.askopenfilename(
+            parent=self.app_context.root,
             title="Seleziona file Excel di input",
-            filetypes=[
-                ("File Excel", "*.xlsx *.xls"),
-                ("XLSX files", "*.xlsx"),
-                ("XLS files", "*.xls"),
-                ("All files", "*.*")
-            ]
+            filetypes=EXCEL_INPUT_FILETYPES
         )
         if filename:
             self.app_context.input_file = filename
@@ -3100,79 +3767,103 @@ class EtichettePDFTab:
             self.update_button_state()
             self.load_tipo_scheda_from_file()
 
-    def load_tipo_scheda_from_file(self):
-        """Carica i CODE 12NC dal file di input"""
-        try:
-            if not self.app_context.input_file:
-                return
+    def leggi_file_condiviso(self, file_path):
+        """Legge i CODE 12NC dal file (non tocca i widget).
 
-            df = pd.read_excel(self.app_context.input_file)
+        Returns:
+            Dizionario {CODE_12NC: DESCRIZIONE} ordinato per CODE 12NC
 
-            if "CODE 12NC" not in df.columns:
-                messagebox.showwarning("Attenzione", "La colonna 'CODE 12NC' non trovata")
-                return
+        Raises:
+            ColonnaMancanteError: Se la colonna 'CODE 12NC' non è presente
+        """
+        # Legge solo le colonne usate, come stringhe (niente inferenza dei tipi)
+        df = leggi_dati_etichette_naz(file_path)
+
+        if "CODE 12NC" not in df.columns:
+            raise ColonnaMancanteError("CODE 12NC")
+
+        # Prova diversi nomi per la colonna descrizione
+        desc_col = None
+        for col_name in ["DESCRIZIONE", "Descrizione", "descrizione"]:
+            if col_name in df.columns:
+                desc_col = col_name
+                break
+
+        # Righe con un codice valido; per ogni codice vale la prima descrizione trovata
+        codes = df["CODE 12NC"]
+        df = df[codes.notna() & (codes != "")]
+        if not desc_col:
+            # Se la colonna descrizione non esiste, usa solo i codici (già ordinati)
+            return dict.fromkeys(sorted(df["CODE 12NC"].unique()), "")
+
+        df = df.drop_duplicates(subset="CODE 12NC", keep="first")
+        code_desc_map = dict(zip(df["CODE 12NC"], df[desc_col].fillna("")))
+
+        # Ordina per CODE 12NC
+        sorted_codes = sorted(code_desc_map.keys())
+        return {code: code_desc_map[code] for code in sorted_codes}
+
+    def load_tipo_scheda_from_file(self, code_desc_map=None, on_loaded=None, errore=None):
+        """Carica i CODE 12NC dal file di input
+
+        Se i CODE 12NC non sono già disponibili il file viene letto nel pool di
+        thread e la lista viene riempita al termine, nel thread Tk.
+
+        Args:
+            code_desc_map: CODE 12NC già letti dal file, se None vengono letti ora
+            on_loaded: Chiamata dopo aver riempito la lista (al posto del messaggio di stato)
+            errore: Errore della lettura già eseguita
+        """
+        if not self.app_context.input_file:
+            return
 
-            # Crea un dizionario con CODE 12NC come chiave e descrizione come valore
-            code_desc_map = {}
-
-            # Prova diversi nomi per la colonna descrizione
-            desc_col = None
-            for col_name in ["DESCRIZIONE", "Descrizione", "descrizione"]:
-                if col_name in df.columns:
-                    desc_col = col_name
-                    break
-
-            if desc_col:
-                for _, row in df.iterrows():
-                    code = str(row["CODE 12NC"]) if pd.notna(row["CODE 12NC"]) else None
-                    desc = str(row[desc_col]) if pd.notna(row[desc_col]) else ""
-                    if code and code not in code_desc_map:
-                        code_desc_map[code] = desc
+        def on_done(code_desc_map):
+            self.load_tipo_scheda(code_desc_map)
+            if on_loaded is not None:
+                on_loaded()
             else:
-                # Se la colonna descrizione non esiste, usa solo i codici
-                code_12nc = [str(t) for t in df["CODE 12NC"].unique() if pd.notna(t)]
-                code_desc_map = {code: "" for code in code_12nc}
+                self.status_label.config(
+                    text=f"Trovati {len(code_desc_map)} CODE 12NC",
+                    foreground="green"
+                )
 
-            # Ordina per CODE 12NC
-            sorted_codes = sorted(code_desc_map.keys())
-            sorted_code_desc_map = {code: code_desc_map[code] for code in sorted_codes}
+        def on_err(e):
+            if isinstance(e, ColonnaMancanteError):
+                messagebox.showwarning("Attenzione", f"La colonna '{e.colonna}' non trovata")
+            else:
+                messagebox.showerror("Errore", f"Errore nel caricamento dei CODE 12NC:\n{str(e)}")
+            self.status_label.config(
+                text="Errore nel caricamento dei CODE 12NC",
+                foreground="red"
+            )
 
-            self.load_tipo_scheda(sorted_code_desc_map)
-        except Exception as e:
-            messagebox.showerror("Errore", f"Errore nel caricamento dei CODE 12NC:\n{str(e)}")
+        if code_desc_map is None and errore is None:
+            self.status_label.config(text="Caricamento CODE 12NC...", foreground="blue")
+        self._carica_file(self.app_context.input_file, code_desc_map, errore, on_done, on_err)
 
     def select_all_tipo_scheda(self):
         """Seleziona tutti i CODE 12NC"""
-        for var in self.tipo_scheda_checkboxes.values():
-            var.set(True)
+        self.code_tree.selection_set(self.code_tree.get_children())
 
     def deselect_all_tipo_scheda(self):
         """Deseleziona tutti i CODE 12NC"""
-        for var in self.tipo_scheda_checkboxes.values():
-            var.set(False)
+        self.code_tree.selection_set(())
 
     def load_tipo_scheda(self, code_desc_map):
-        """Carica i CODE 12NC disponibili e crea le checkbox
+        """Carica i CODE 12NC disponibili nella lista (l'iid di ogni riga è il CODE 12NC)
 
         Args:
             code_desc_map: Dizionario {CODE_12NC: DESCRIZIONE} oppure lista di CODE_12NC
         """
-        for widget in self.checkbox_frame.winfo_children():
-            widget.destroy()
-        self.tipo_scheda_checkboxes.clear()
-
         # Se è una lista (retrocompatibilità), converti in dizionario
         if isinstance(code_desc_map, list):
             code_desc_map = {code: "" for code in code_desc_map}
 
-        for idx, (code, desc) in enumerate(code_desc_map.items()):
-            var = tk.BooleanVar(value=False)
-            # Mostra CODE 12NC - DESCRIZIONE se la descrizione esiste
-            label_text = f"{code} - {desc}" if desc else code
-            cb = ttk.Checkbutton(self.checkbox_frame, text=label_text, variable=var)
-            cb.grid(row=idx, column=0, sticky=tk.W, padx=5, pady=2)
-            self.tipo_scheda_checkboxes[code] = var
-            cb.configure(state='normal')
+        # Mostra CODE 12NC - DESCRIZIONE se la descrizione esiste
+        riempi_treeview(
+            self.code_tree,
+            ((code, f"{code} - {desc}" if desc else code) for code, desc in code_desc_map.items())
+        )
 
     def select_image_file(self):
         """Seleziona il file immagine per il logo"""
@@ -3181,14 +3872,10 @@ class EtichettePDFTab:
             initialdir = Path(self.app_context.input_file).parent
 
         filename = filedialog.askopenfilename(
+            parent=self.app_context.root,
             title="Seleziona immagine logo",
             initialdir=initialdir,
-            filetypes=[
-                ("Immagini", "*.png *.jpg *.jpeg"),
-                ("PNG files", "*.png"),
-                ("JPEG files", "*.jpg *.jpeg"),
-                ("All files", "*.*")
-            ]
+            filetypes=IMAGE_FILETYPES
         )
         if filename:
             self.app_context.etichettepdf_image_file = filename
@@ -3205,53 +3892,45 @@ class EtichettePDFTab:
             initialfile = "Etichette Naz.pdf"
 
         filename = filedialog.asksaveasfilename(
+            parent=self.app_context.root,
             title="Scegli percorso e nome file PDF",
             initialdir=initialdir,
             initialfile=initialfile,
             defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+            filetypes=PDF_FILETYPES
         )
         if filename:
             self.app_context.etichettepdf_output_file = Path(filename)
             self.output_label.config(text=f"{self.app_context.etichettepdf_output_file.name}", foreground="green")
             self.update_button_state()
 
-    def update_button_state(self):
-        """Abilita il bottone GENERA PDF solo se input e output sono impostati"""
+    def _input_output_impostati(self):
+        """Indica se input e output sono impostati (abilita il bottone GENERA)"""
         has_input = hasattr(self.app_context, 'input_file') and self.app_context.input_file is not None
         has_output = hasattr(self.app_context, 'etichettepdf_output_file') and self.app_context.etichettepdf_output_file is not None
+        return has_input and has_output
 
-        if has_input and has_output:
-            self.generate_button.state(['!disabled'])
-        else:
-            self.generate_button.state(['disabled'])
+    def load_shared_input_file(self, file_path, dati=None, errore=None):
+        """Carica il file di input condiviso.
 
-    def load_shared_input_file(self, file_path):
-        """Carica il file di input condiviso."""
+        Args:
+            file_path: Percorso del file condiviso
+            dati: Dati già letti con leggi_file_condiviso, se None vengono letti ora
+            errore: Errore della lettura già eseguita
+        """
         self.app_context.input_file = str(file_path)
         self.input_label.config(
             text=f"{Path(file_path).name} (File Condiviso)",
             foreground="blue"
         )
         self.update_button_state()
-        self.load_tipo_scheda_from_file()
-        self.status_label.config(
-            text="File condiviso caricato",
-            foreground="blue"
-        )
-
-    def load_from_main_tab(self, generated_file_path):
-        """Carica automaticamente il file generato dalla scheda principale."""
-        self.app_context.input_file = str(generated_file_path)
-        self.input_label.config(
-            text=Path(generated_file_path).name,
-            foreground="green"
-        )
-        self.update_button_state()
-        self.load_tipo_scheda_from_file()
-        self.status_label.config(
-            text="File pronto per la generazione",
-            foreground="green"
+        self.load_tipo_scheda_from_file(
+            dati,
+            on_loaded=lambda: self.status_label.config(
+                text="File condiviso caricato",
+                foreground="blue"
+            ),
+            errore=errore
         )
 
     def generate_pdf(self):
@@ -3267,77 +3946,98 @@ class EtichettePDFTab:
                 )
                 return
 
-            self.status_label.config(text="Generazione PDF in corso...", foreground="blue")
-            self.progress.start()
-            self.app_context.root.update()
-
             filter_enabled = self.filter_enabled_var.get()
             selected_tipo_scheda = None
 
             if filter_enabled:
-                selected_tipo_scheda = [tipo for tipo, var in self.tipo_scheda_checkboxes.items() if var.get()]
+                selected_tipo_scheda = list(self.code_tree.selection())
 
                 if not selected_tipo_scheda:
                     messagebox.showwarning("Attenzione", "Seleziona almeno un CODE 12NC!")
-                    self.progress.stop()
                     return
 
             repetitions = self.repetitions_var.get()
             start_column = self.start_column_var.get()
             start_row = self.start_row_var.get()
+        except Exception as e:
+            messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
 
-            label_count = PDFLabelGenerator.generate_pdf_labels(
-                self.app_context.input_file,
-                self.app_context.etichettepdf_output_file,
+        input_file = self.app_context.input_file
+        output_file = self.app_context.etichettepdf_output_file
+
+        def genera():
+            # Eseguita nel thread di lavoro: legge il file (o la cache) e scrive il PDF
+            return PDFLabelGenerator.generate_pdf_labels(
+                input_file,
+                output_file,
                 image_path,
                 filter_enabled,
                 selected_tipo_scheda,
                 repetitions,
                 start_column,
-                start_row
+                start_row,
+                df=leggi_dati_etichette_naz(input_file)
             )
 
-            self.progress.stop()
-            self.status_label.config(
-                text=f"PDF generato! Etichette create: {label_count}",
-                foreground="green"
-            )
+        self.status_label.config(text="Generazione PDF in corso...", foreground="blue")
+        # Il bottone resta disabilitato finché la generazione non è terminata
+        self.generate_button.state(['disabled'])
+        self.progress.start()
 
-            if filter_enabled:
-                msg = (f"File PDF generato con successo!\n\n"
-                       f"File output:\n{self.app_context.etichettepdf_output_file}\n\n"
-                       f"Etichette generate: {label_count}\n"
-                       f"CODE 12NC inclusi: {len(selected_tipo_scheda)}")
-            else:
-                msg = (f"File PDF generato con successo!\n\n"
-                       f"File output:\n{self.app_context.etichettepdf_output_file}\n\n"
-                       f"Etichette generate: {label_count}")
+        future = self.app_context._executor.submit(genera)
 
-            messagebox.showinfo("Successo", msg)
+        self._segui_generazione(
+            future,
+            lambda future: self._on_pdf_generato(future, output_file, selected_tipo_scheda)
+        )
 
+    def _on_pdf_generato(self, future, output_file, selected_tipo_scheda):
+        """Mostra l'esito della generazione del PDF (thread Tk)."""
+        try:
+            label_count = future.result()
         except ValueError as ve:
-            self.progress.stop()
             self.status_label.config(text="Nessuna etichetta da generare", foreground="red")
             messagebox.showwarning("Attenzione", str(ve))
+            return
         except Exception as e:
-            self.progress.stop()
             self.status_label.config(text="Errore durante la generazione", foreground="red")
             messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
+
+        self.status_label.config(
+            text=f"PDF generato! Etichette create: {label_count}",
+            foreground="green"
+        )
+
+        if selected_tipo_scheda is not None:
+            msg = (f"File PDF generato con successo!\n\n"
+                   f"File output:\n{output_file}\n\n"
+                   f"Etichette generate: {label_count}\n"
+                   f"CODE 12NC inclusi: {len(selected_tipo_scheda)}")
+        else:
+            msg = (f"File PDF generato con successo!\n\n"
+                   f"File output:\n{output_file}\n\n"
+                   f"Etichette generate: {label_count}")
+
+        messagebox.showinfo("Successo", msg)
 
 
 # ============================================================================
 # TAB Etichette Interne
 # ============================================================================
 
-class EtichetteWordTab:
+class EtichetteWordTab(_SchedaFileMixin):
     """Gestisce la scheda Etichette Interne"""
 
     def __init__(self, notebook, app_context):
         self.notebook = notebook
         self.app_context = app_context
-        self.tipo_scheda_checkboxes = {}
+        self._init_scheda()
         # mappa checkbox_label -> (descrizione, prefisso_tipo) usata dalla scheda Word
         self._word_label_mapping: Dict[str, tuple] = {}
+        # descrizione -> tipi scheda presenti nel file, per tradurre la selezione
+        self._tipi_per_descrizione: Dict[str, List[str]] = {}
         self.filter_enabled_var = tk.BooleanVar(value=True)
 
         self.frame = ttk.Frame(self.notebook)
@@ -3359,11 +4059,7 @@ class EtichetteWordTab:
         self.scrollable_frame = ttk.Frame(canvas)
 
         def update_scrollregion(event=None):
-            # Aggiorna la scrollregion basandosi sul contenuto effettivo
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Reset alla posizione iniziale se necessario
-            if canvas.yview()[0] < 0:
-                canvas.yview_moveto(0)
+            self._pianifica_scrollregion(canvas)
 
         self.scrollable_frame.bind("<Configure>", update_scrollregion)
 
@@ -3406,25 +4102,22 @@ class EtichetteWordTab:
         checkbox_container = ttk.Frame(self.scrollable_frame)
         checkbox_container.grid(row=4, column=0, columnspan=3, sticky="nsew", pady=5, padx=10)
 
-        canvas_cb = tk.Canvas(checkbox_container, height=150, highlightthickness=0)
-        scrollbar_cb = ttk.Scrollbar(checkbox_container, orient="vertical", command=canvas_cb.yview)
-        self.checkbox_frame = ttk.Frame(canvas_cb)
-
-        self.checkbox_frame.bind(
-            "<Configure>",
-            lambda _: canvas_cb.configure(scrollregion=canvas_cb.bbox("all"))
+        # Un'unica Treeview al posto di una Checkbutton per elemento:
+        # gli elementi selezionati sono quelli inclusi nella generazione
+        self.tipo_tree = ttk.Treeview(
+            checkbox_container,
+            show="tree",
+            selectmode="extended",
+            height=7
         )
+        tipo_scrollbar = ttk.Scrollbar(checkbox_container, orient="vertical", command=self.tipo_tree.yview)
+        self.tipo_tree.configure(yscrollcommand=tipo_scrollbar.set)
 
-        checkbox_canvas_window = canvas_cb.create_window((0, 0), window=self.checkbox_frame, anchor="nw")
-        canvas_cb.configure(yscrollcommand=scrollbar_cb.set)
-
-        def on_checkbox_canvas_configure(event):
-            canvas_cb.itemconfig(checkbox_canvas_window, width=event.width)
-
-        canvas_cb.bind("<Configure>", on_checkbox_canvas_configure)
+        # Il click alterna la selezione della riga, come una checkbox
+        self.tipo_tree.bind("<Button-1>", alterna_selezione_riga)
 
-        canvas_cb.pack(side="left", fill="both", expand=True)
-        scrollbar_cb.pack(side="right", fill="y")
+        self.tipo_tree.pack(side="left", fill="both", expand=True)
+        tipo_scrollbar.pack(side="right", fill="y")
 
         buttons_frame = ttk.Frame(self.scrollable_frame)
         buttons_frame.grid(row=5, column=0, columnspan=3, pady=5)
@@ -3505,13 +4198,9 @@ class EtichetteWordTab:
     def select_input_file(self):
         """Seleziona il file Excel di input"""
         filename = filedialog.askopenfilename(
+            parent=self.app_context.root,
             title="Seleziona file Excel di input",
-            filetypes=[
-                ("File Excel", "*.xlsx *.xls"),
-                ("XLSX files", "*.xlsx"),
-                ("XLS files", "*.xls"),
-                ("All files", "*.*")
-            ]
+            filetypes=EXCEL_INPUT_FILETYPES
         )
         if filename:
             self.app_context.input_file = filename
@@ -3519,64 +4208,96 @@ class EtichetteWordTab:
             self.update_button_state()
             self.load_tipo_scheda_from_file()
 
-    def load_tipo_scheda_from_file(self):
-        """Carica la lista di componenti mostrata nella selezione.
+    def leggi_file_condiviso(self, file_path):
+        """Legge dal file le etichette da mostrare nella selezione (non tocca i widget).
 
-        Mostriamo per ogni componente la descrizione e il prefisso del tipo scheda
-        (es. "NOME COMPONENTE - SU"). Se il prefisso non è disponibile viene mostrata
-        solo la descrizione.
+        Returns:
+            Tupla (etichette, mapping {etichetta: (descrizione, prefisso)},
+            {descrizione: tipi scheda nell'ordine del file})
+
+        Raises:
+            ColonnaMancanteError: Se la colonna 'Descrizione' non è presente
         """
-        try:
-            if not self.app_context.input_file:
-                return
+        df = leggi_dati_etichette_interne(file_path)
 
-            df = pd.read_excel(self.app_context.input_file)
+        if "Descrizione" not in df.columns:
+            raise ColonnaMancanteError("Descrizione")
 
-            if "Descrizione" not in df.columns:
-                messagebox.showwarning("Attenzione", "La colonna 'Descrizione' non trovata")
-                return
+        # Tipi scheda distinti per descrizione, raccolti con un solo passaggio sul file
+        tipi_per_descr = {}
+        prefisso_per_descr = {}
+        if "Tipo Scheda" in df.columns:
+            coppie = df[["Descrizione", "Tipo Scheda"]].dropna().drop_duplicates()
+            for descr, tipo in zip(coppie["Descrizione"], coppie["Tipo Scheda"]):
+                tipi_per_descr.setdefault(descr, []).append(str(tipo))
 
             # Tipo Scheda può mancare per alcune righe; usiamo la prima occorrenza per descrizione
-            descrizioni = [d for d in df["Descrizione"].unique() if pd.notna(d)]
+            # e ne estraiamo il prefisso rimuovendo le cifre finali (su tutta la colonna insieme)
+            primi = coppie.drop_duplicates(subset="Descrizione")
+            prefissi = (primi["Tipo Scheda"].astype(str).str.strip()
+                        .str.replace(r"\d+$", "", regex=True).str.strip())
+            prefisso_per_descr = dict(zip(primi["Descrizione"], prefissi))
 
-            items = []
-            self._word_label_mapping.clear()
+        descrizioni = [d for d in df["Descrizione"].unique() if pd.notna(d)]
 
-            for descr in sorted(descrizioni):
-                # Trova la prima riga con questa descrizione che abbia un Tipo Scheda
-                sub = df[df["Descrizione"] == descr]
-                tipo_val = None
-                if "Tipo Scheda" in df.columns:
-                    non_null = sub["Tipo Scheda"].dropna()
-                    if not non_null.empty:
-                        tipo_val = str(non_null.iloc[0]).strip()
-
-                # Estrai prefisso rimuovendo cifre finali
-                prefisso = ""
-                if tipo_val:
-                    prefisso = re.sub(r"\d+$", "", tipo_val).strip()
-
-                if prefisso:
-                    label = f"{descr} - {prefisso}"
-                else:
-                    label = f"{descr}"
+        items = []
+        mapping = {}
+
+        for descr in sorted(descrizioni):
+            prefisso = prefisso_per_descr.get(descr, "")
+
+            if prefisso:
+                label = f"{descr} - {prefisso}"
+            else:
+                label = f"{descr}"
+
+            items.append(label)
+            mapping[label] = (descr, prefisso)
+
+        return items, mapping, tipi_per_descr
+
+    def load_tipo_scheda_from_file(self, dati=None, on_loaded=None, errore=None):
+        """Carica la lista di componenti mostrata nella selezione.
 
-                items.append(label)
-                self._word_label_mapping[label] = (descr, prefisso)
+        Mostriamo per ogni componente la descrizione e il prefisso del tipo scheda
+        (es. "NOME COMPONENTE - SU"). Se il prefisso non è disponibile viene mostrata
+        solo la descrizione. Se i dati non sono già disponibili il file viene letto
+        nel pool di thread e la lista viene riempita al termine, nel thread Tk.
+
+        Args:
+            dati: Risultato di leggi_file_condiviso, se None il file viene letto ora
+            on_loaded: Chiamata dopo aver riempito la lista
+            errore: Errore della lettura già eseguita
+        """
+        if not self.app_context.input_file:
+            return
+
+        def on_done(dati):
+            items, mapping, tipi_per_descr = dati
+
+            self._word_label_mapping.clear()
+            self._word_label_mapping.update(mapping)
+            self._tipi_per_descrizione = tipi_per_descr
 
             self.load_tipo_scheda(items)
-        except Exception as e:
-            messagebox.showerror("Errore", f"Errore nel caricamento dei dati:\n{str(e)}")
+            if on_loaded is not None:
+                on_loaded()
+
+        def on_err(e):
+            if isinstance(e, ColonnaMancanteError):
+                messagebox.showwarning("Attenzione", f"La colonna '{e.colonna}' non trovata")
+            else:
+                messagebox.showerror("Errore", f"Errore nel caricamento dei dati:\n{str(e)}")
+
+        self._carica_file(self.app_context.input_file, dati, errore, on_done, on_err)
 
     def select_all_tipo_scheda(self):
         """Seleziona tutti i tipi scheda"""
-        for var in self.tipo_scheda_checkboxes.values():
-            var.set(True)
+        self.tipo_tree.selection_set(self.tipo_tree.get_children())
 
     def deselect_all_tipo_scheda(self):
         """Deseleziona tutti i tipi scheda"""
-        for var in self.tipo_scheda_checkboxes.values():
-            var.set(False)
+        self.tipo_tree.selection_set(())
 
     def select_output_file(self):
         """Seleziona il percorso di output"""
@@ -3588,163 +4309,152 @@ class EtichetteWordTab:
             initialfile = "Etichette Interne.pdf"
 
         filename = filedialog.asksaveasfilename(
+            parent=self.app_context.root,
             title="Scegli percorso e nome file Etichette Naz",
             initialdir=initialdir,
             initialfile=initialfile,
             defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+            filetypes=PDF_FILETYPES
         )
         if filename:
             self.app_context.etichetteword_output_file = Path(filename)
             self.output_label.config(text=f"{self.app_context.etichetteword_output_file.name}", foreground="green")
             self.update_button_state()
 
-    def update_button_state(self):
-        """Abilita il bottone GENERA"""
+    def _input_output_impostati(self):
+        """Indica se input e output sono impostati (abilita il bottone GENERA)"""
         has_input = hasattr(self.app_context, 'input_file') and self.app_context.input_file is not None
         has_output = hasattr(self.app_context, 'etichetteword_output_file') and self.app_context.etichetteword_output_file is not None
+        return has_input and has_output
 
-        if has_input and has_output:
-            self.generate_button.state(['!disabled'])
-        else:
-            self.generate_button.state(['disabled'])
+    def load_shared_input_file(self, file_path, dati=None, errore=None):
+        """Carica il file di input condiviso.
 
-    def load_shared_input_file(self, file_path):
-        """Carica il file di input condiviso."""
+        Args:
+            file_path: Percorso del file condiviso
+            dati: Dati già letti con leggi_file_condiviso, se None vengono letti ora
+            errore: Errore della lettura già eseguita
+        """
         self.app_context.input_file = str(file_path)
         self.input_label.config(
             text=f"{Path(file_path).name} (File Condiviso)",
             foreground="blue"
         )
         self.update_button_state()
-        self.load_tipo_scheda_from_file()
-        self.status_label.config(
-            text="File condiviso caricato",
-            foreground="blue"
-        )
-
-    def load_from_main_tab(self, generated_file_path):
-        """Carica automaticamente il file generato."""
-        self.app_context.input_file = str(generated_file_path)
-        self.input_label.config(
-            text=Path(generated_file_path).name,
-            foreground="green"
-        )
-        self.update_button_state()
-        self.load_tipo_scheda_from_file()
-        self.status_label.config(
-            text="File pronto per la generazione",
-            foreground="green"
+        self.load_tipo_scheda_from_file(
+            dati,
+            on_loaded=lambda: self.status_label.config(
+                text="File condiviso caricato",
+                foreground="blue"
+            ),
+            errore=errore
         )
 
     def load_tipo_scheda(self, tipi_scheda):
-        """Carica i tipi scheda disponibili"""
-        for widget in self.checkbox_frame.winfo_children():
-            widget.destroy()
-        self.tipo_scheda_checkboxes.clear()
-
-        for idx, tipo in enumerate(tipi_scheda):
-            var = tk.BooleanVar(value=False)
-            cb = ttk.Checkbutton(self.checkbox_frame, text=tipo, variable=var)
-            cb.grid(row=idx, column=0, sticky=tk.W, padx=5, pady=2)
-            self.tipo_scheda_checkboxes[tipo] = var
-            cb.configure(state='normal')
+        """Carica i tipi scheda disponibili (l'iid di ogni riga è l'etichetta stessa)"""
+        riempi_treeview(self.tipo_tree, ((tipo, tipo) for tipo in tipi_scheda))
 
     def generate_etichetteword(self):
         """Genera il documento Word con le etichette"""
         try:
-            self.status_label.config(text="Generazione Etichette Interne in corso...", foreground="blue")
-            self.progress.start()
-            self.app_context.root.update()
-
             filter_enabled = self.filter_enabled_var.get()
             selected_tipo_scheda = None
 
             if filter_enabled:
-                # Le checkbox ora contengono etichette del tipo "DESCRIZIONE - PREFISSO"
-                selected_labels = [lbl for lbl, var in self.tipo_scheda_checkboxes.items() if var.get()]
+                # Le righe della lista sono etichette del tipo "DESCRIZIONE - PREFISSO"
+                selected_labels = list(self.tipo_tree.selection())
 
                 if not selected_labels:
                     messagebox.showwarning("Attenzione", "Seleziona almeno un elemento dalla lista!")
-                    self.progress.stop()
-                    return
-
-                # Traduci le etichette selezionate in tipi scheda reali leggendo il file di input
-                try:
-                    df = pd.read_excel(self.app_context.input_file)
-                except Exception as e:
-                    self.progress.stop()
-                    messagebox.showerror("Errore", f"Impossibile leggere il file di input:\n{e}")
                     return
 
-                selected_tipo_scheda = []
+                # Traduci le etichette selezionate nei tipi scheda letti insieme alla lista, senza duplicati
+                tipi_selezionati = set()
                 for lbl in selected_labels:
                     mapping = self._word_label_mapping.get(lbl)
                     if not mapping:
                         continue
                     descr, prefisso = mapping
-                    # Filtra le righe corrispondenti alla descrizione
-                    sub = df[df['Descrizione'] == descr]
-                    if 'Tipo Scheda' in df.columns:
-                        if prefisso:
-                            matches = sub[sub['Tipo Scheda'].astype(str).str.startswith(prefisso, na=False)]['Tipo Scheda'].unique()
-                        else:
-                            matches = sub['Tipo Scheda'].dropna().unique()
-                        for m in matches:
-                            selected_tipo_scheda.append(str(m))
+                    tipi = self._tipi_per_descrizione.get(descr, ())
+                    if prefisso:
+                        tipi_selezionati.update(t for t in tipi if t.startswith(prefisso))
+                    else:
+                        tipi_selezionati.update(tipi)
 
-                # rimuovi duplicati
-                selected_tipo_scheda = sorted(list(dict.fromkeys(selected_tipo_scheda)))
+                selected_tipo_scheda = sorted(tipi_selezionati)
 
                 if not selected_tipo_scheda:
                     messagebox.showwarning("Attenzione", "Nessun Tipo Scheda trovato per le selezioni effettuate")
-                    self.progress.stop()
                     return
 
             repetitions = getattr(self, 'repetitions_var', tk.IntVar(value=1)).get()
             start_column = getattr(self, 'start_column_var', tk.IntVar(value=1)).get()
             start_row = getattr(self, 'start_row_var', tk.IntVar(value=1)).get()
             add_black_labels = getattr(self, 'add_black_labels_var', tk.BooleanVar(value=True)).get()
+        except Exception as e:
+            messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
+
+        input_file = self.app_context.input_file
+        output_file = self.app_context.etichetteword_output_file
 
-            label_count = WordLabelGenerator.generate_word_labels(
-                self.app_context.input_file,
-                self.app_context.etichetteword_output_file,
+        def genera():
+            # Eseguita nel thread di lavoro: legge il file (o la cache) e scrive il PDF
+            return WordLabelGenerator.generate_word_labels(
+                input_file,
+                output_file,
                 filter_enabled,
                 selected_tipo_scheda,
                 repetitions,
                 start_column,
                 start_row,
-                add_black_labels=add_black_labels
+                add_black_labels=add_black_labels,
+                df=leggi_dati_etichette_interne(input_file)
             )
 
-            self.progress.stop()
-            self.status_label.config(
-                text=f"Etichette Interne generate! Etichette totali: {label_count}",
-                foreground="green"
-            )
+        self.status_label.config(text="Generazione Etichette Interne in corso...", foreground="blue")
+        # Il bottone resta disabilitato finché la generazione non è terminata
+        self.generate_button.state(['disabled'])
+        self.progress.start()
 
-            if filter_enabled:
-                msg = (f"File Etichette Interne generato con successo!\n\n"
-                       f"File output:\n{self.app_context.etichetteword_output_file}\n\n"
-                       f"Etichette generate: {label_count}\n"
-                       f"Tipi scheda inclusi: {len(selected_tipo_scheda)}\n"
-                       f"Formato: A4 Portrate con righe alternate bianco/nero")
-            else:
-                msg = (f"File Etichette Interne generato con successo!\n\n"
-                       f"File output:\n{self.app_context.etichetteword_output_file}\n\n"
-                       f"Etichette generate: {label_count}\n"
-                       f"Formato: A4 Portrate con righe alternate bianco/nero")
+        future = self.app_context._executor.submit(genera)
 
-            messagebox.showinfo("Successo", msg)
+        self._segui_generazione(
+            future,
+            lambda future: self._on_etichetteword_generato(future, output_file, selected_tipo_scheda)
+        )
 
+    def _on_etichetteword_generato(self, future, output_file, selected_tipo_scheda):
+        """Mostra l'esito della generazione delle Etichette Interne (thread Tk)."""
+        try:
+            label_count = future.result()
         except ValueError as ve:
-            self.progress.stop()
             self.status_label.config(text="Nessuna etichetta da generare", foreground="red")
             messagebox.showwarning("Attenzione", str(ve))
+            return
         except Exception as e:
-            self.progress.stop()
             self.status_label.config(text="Errore durante la generazione", foreground="red")
             messagebox.showerror("Errore", f"Si è verificato un errore:\n\n{str(e)}")
+            return
+
+        self.status_label.config(
+            text=f"Etichette Interne generate! Etichette totali: {label_count}",
+            foreground="green"
+        )
+
+        if selected_tipo_scheda is not None:
+            msg = (f"File Etichette Interne generato con successo!\n\n"
+                   f"File output:\n{output_file}\n\n"
+                   f"Etichette generate: {label_count}\n"
+                   f"Tipi scheda inclusi: {len(selected_tipo_scheda)}\n"
+                   f"Formato: A4 Portrate con righe alternate bianco/nero")
+        else:
+            msg = (f"File Etichette Interne generato con successo!\n\n"
+                   f"File output:\n{output_file}\n\n"
+                   f"Etichette generate: {label_count}\n"
+                   f"Formato: A4 Portrate con righe alternate bianco/nero")
+
+        messagebox.showinfo("Successo", msg)
 
 
 
@@ -3901,6 +4611,7 @@ class MergeDocTab:
     def _aggiungi_file(self):
         """Aggiunge uno o più file Excel alla lista."""
         files = filedialog.askopenfilenames(
+            parent=self.app_context.root,
             title="Seleziona file Excel da unire",
             filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
         )
@@ -3993,9 +4704,10 @@ class MergeDocTab:
     def _scegli_output(self):
         """Apre il dialog per scegliere il file di output."""
         file = filedialog.asksaveasfilename(
+            parent=self.app_context.root,
             title="Scegli destinazione file unito",
             defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
+            filetypes=EXCEL_FILETYPES
         )
 
         if file: